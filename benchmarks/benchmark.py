@@ -0,0 +1,199 @@
+""" Benchmark : import, data loading and nubar over the whole library """
+
+import argparse
+import glob
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from importlib.metadata import PackageNotFoundError, version
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
+from ffdd.cache import CACHE_ENV
+from ffdd.yields import (
+    read_fission_yields,
+    fission_fragments_coupled,
+    yields_cache_clear,
+    _yields_file,
+)
+from ffdd.decay import nubar
+from ffdd.averages import fission_averages
+
+# available target nuclei
+
+
+def library_targets():
+    """
+    Target nuclei of the ENDF/BVIII.0 evaluations shipped with FFDD.
+
+    Returns:
+        list: (A, Z) of each target.
+    """
+
+    yields_dir = os.path.join(os.path.dirname(__file__), '..', 'ffdd', 'data', 'yields')
+    pattern = re.compile(r"nfy-(\d+)_([A-Za-z]+)_(\d+)\.endf")
+    targets = []
+    for f in sorted(os.listdir(yields_dir)):
+        match = pattern.match(f)
+        if match:
+            z_str, _, a_str = match.groups()
+            targets.append((int(a_str), int(z_str)))
+    return targets
+
+
+# timing function
+
+
+def timeit(func, repeat):
+    """
+    Wall time of a function call.
+
+    Args:
+        func (callable): Function without arguments.
+        repeat (int): Number of calls.
+
+    Returns:
+        dict: Median, minimum and maximum wall time (s) over the calls.
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {'median': statistics.median(times), 'min': min(times), 'max': max(times)}
+
+
+def cold_import(repeat):
+    """ Wall time of 'import ffdd.decay' in fresh interpreters. """
+
+    code = "import time; t = time.perf_counter(); import ffdd.decay; print(time.perf_counter() - t)"
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                                capture_output=True, text=True).stdout
+        times.append(float(output))
+    return {'median': statistics.median(times), 'min': min(times), 'max': max(times)}
+
+
+@contextmanager
+def temporary_cache():
+    """ Binary caches in a temporary directory (the user's cache is not touched). """
+
+    previous = os.environ.get(CACHE_ENV)
+    with tempfile.TemporaryDirectory(prefix='ffdd-benchmark-') as path:
+        os.environ[CACHE_ENV] = path
+        try:
+            yield path
+        finally:
+            if previous is None:
+                del os.environ[CACHE_ENV]
+            else:
+                os.environ[CACHE_ENV] = previous
+
+
+# benchmark
+
+
+def benchmark(repeat=5):
+    """
+    Benchmark of cold import, yields reading (conversion of the ENDF file and load
+    of the converted store), fragments coupling and nubar (Fong and von Edigy models)
+    for each target of the library, with the binary caches in a temporary directory.
+
+    Args:
+        repeat (int): Number of calls of each measurement.
+
+    Returns:
+        dict: Machine-readable results.
+    """
+
+    with temporary_cache() as cache:
+        results = _benchmark(repeat, cache)
+
+    try:
+        ffdd_version = version('ffdd')
+    except PackageNotFoundError:
+        ffdd_version = None
+
+    return {
+        'ffdd': ffdd_version,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def _benchmark(repeat, cache):
+    """ Measurements of benchmark, with the binary caches in the directory cache. """
+
+    results = [{'name': 'import ffdd.decay', 'target': None, **cold_import(repeat)}]
+
+    for a_target, z_target in library_targets():
+
+        target = f'{a_target},{z_target}'
+        store = os.path.splitext(os.path.basename(_yields_file(a_target, z_target)))[0]
+
+        def read_cold():
+            for path in glob.glob(os.path.join(cache, f'yields-v*-{store}-*.npz')):
+                os.remove(path)
+            yields_cache_clear()
+            return read_fission_yields(a_target, z_target)
+
+        def read_warm():
+            yields_cache_clear()
+            return read_fission_yields(a_target, z_target)
+
+        results.append({
+            'name': 'read_fission_yields[cold]', 'target': target, **timeit(read_cold, repeat),
+        })
+        results.append({
+            'name': 'read_fission_yields[warm]', 'target': target, **timeit(read_warm, repeat),
+        })
+        _, nfy_list = read_warm()
+
+        def couple():
+            return [fission_fragments_coupled(a_target, z_target, nfy) for nfy in nfy_list]
+
+        results.append({
+            'name': 'fission_fragments_coupled', 'target': target, **timeit(couple, repeat),
+        })
+        for model in ['fong', 'edigy']:
+            results.append({
+                'name': f'nubar[{model}]',
+                'target': target,
+                **timeit(lambda: nubar(a_target, z_target, model=model), repeat),
+            })
+            results.append({
+                'name': f'fission_averages[{model}]',
+                'target': target,
+                **timeit(lambda: fission_averages(a_target, z_target, model=model), repeat),
+            })
+
+    return results
+
+
+# run
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5, help='calls per measurement')
+    parser.add_argument('--output', default='benchmark.json', help='JSON results file')
+    args = parser.parse_args()
+
+    report = benchmark(args.repeat)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    for r in report['results']:
+        print(f"{r['name']:28s} {r['target'] or '':8s} {1e3 * r['median']:10.3f} ms")
@@ -6,7 +6,7 @@ import sys
 import os
 import matplotlib.pyplot as plt
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from ffdd.decay import nubar
+from ffdd.sweep import nubar_grid
 
 # study function
 
@@ -34,9 +34,12 @@ def example():
 
     _, ax = plt.subplots(figsize=(8, 6))
 
-    for beta in beta_list:
+    grid = nubar_grid(a_target, z_target, beta=beta_list, ekin=[ekin], rt=[1], model=['fong'])
+    energy = grid.coords["energy"]
 
-        energy, nu = nubar(a_target, z_target, ekin, beta=beta, model='fong', rt=1)
+    for k, beta in enumerate(beta_list):
+
+        nu = grid.values[:, k, 0, 0, 0]
         plt.scatter(
             energy, nu, marker="s", linestyle="-", label=f"FFDD with β = {beta}"
         )
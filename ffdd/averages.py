@@ -0,0 +1,108 @@
+""" Fission averages of all incident energies as matrix-vector products """
+
+# librairies
+
+import numpy as np
+from collections import namedtuple
+from ffdd.yields import read_fission_pairs
+from ffdd.prepared import prepare_fragmentation
+from ffdd.cascade import CHUNK_SIZE
+from ffdd.instrument import count, enabled
+
+# averages over fragmentations for each incident energy
+
+FissionAverages = namedtuple("FissionAverages", ["energies", "nubar", "tke", "txe"])
+
+# averages of prepared fragmentations for a matrix of probabilities
+
+
+def pair_averages(prepared, energies, p, ekin = 2.0, beta = 0.2, rt = 1):
+    """
+    Average neutron multiplicity, total kinetic energy and total excitation energy
+    of prepared fragmentations, for fragmentation probabilities given as an
+    (energies x pairs) matrix: each average is a product of this matrix with a vector
+    (or a row-wise product for the energy-dependent multiplicities).
+
+    Args:
+        prepared (PreparedFragmentation): Prepared fragmentations (pairs).
+        energies (float array): Incident energies (MeV).
+        p (float array): Fragmentation probabilities (energies x pairs).
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+        beta (float): Average quadrupolar deformation of fragments.
+        rt (float): Anisothermal coefficient.
+
+    Returns:
+        averages (FissionAverages): For each incident energy,
+              energies (float array): Incident energies (MeV),
+              nubar (float array): Average total number of emitted neutrons,
+              tke (float array): Average total kinetic energy (MeV),
+              txe (float array): Average total excitation energy (MeV).
+    """
+
+    energies = np.atleast_1d(np.asarray(energies, dtype=float))
+    p = np.atleast_2d(p)
+
+    # probabilities of the fragmentations with available masses (energies x pairs)
+
+    valid = prepared.valid
+    w = np.where(valid, p, 0.0)
+    norm = w.sum(axis=1)
+
+    # energy-independent terms: matrix-vector products
+
+    tke_ff = np.where(valid, prepared.tke0 / (1 + 2 * beta), 0.0)
+    q0 = np.where(valid, prepared.q0, 0.0)
+    tke_mean = (w @ tke_ff) / norm
+    txe_mean = (w @ q0) / norm + energies - tke_mean
+
+    # neutron emissions of all (energy, fragmentation) couples, by chunks of energies
+
+    nubar = np.empty(energies.size)
+    rows = max(1, CHUNK_SIZE // max(1, prepared.ah.size))
+
+    for start in range(0, energies.size, rows):
+        k = slice(start, start + rows)
+        nuh, nul, _ = prepared.multiplicities(energies[k, None], ekin=ekin, beta=beta, rt=rt)
+        nubar[k] = np.einsum("ij,ij->i", w[k], nuh + nul) / norm[k]
+
+        # counters of the listed fragmentations
+
+        if enabled():
+            listed = p[k] > 0
+            skipped_q = np.isnan(prepared.q0)
+            count("fragmentations", np.count_nonzero(listed))
+            count("skipped_q_value", np.count_nonzero(listed & skipped_q))
+            count("skipped_sharing", np.count_nonzero(listed & ~skipped_q & ~valid))
+            count("zero_emission", np.count_nonzero(listed & valid & (nuh + nul == 0)))
+
+    return FissionAverages(energies, nubar, tke_mean, txe_mean)
+
+
+# averages of all incident energies at once
+
+
+def fission_averages(a_target, z_target, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1):
+    """
+    Average neutron multiplicity, total kinetic energy and total excitation energy
+    in fission for all the incident energies of the evaluation at once (see pair_averages).
+
+    Args:
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+        beta (float): Average quadrupolar deformation of fragments.
+        model (str): Energy sharing model ('fong' or 'edigy').
+        rt (float): Anisothermal coefficient.
+
+    Returns:
+        averages (FissionAverages): For each incident energy,
+              energies (float array): Incident energies (MeV),
+              nubar (float array): Average total number of emitted neutrons,
+              tke (float array): Average total kinetic energy (MeV),
+              txe (float array): Average total excitation energy (MeV).
+    """
+
+    pairs = read_fission_pairs(a_target, z_target)
+    prepared = prepare_fragmentation(a_target, z_target, model)
+
+    return pair_averages(prepared, pairs.energies, pairs.p, ekin=ekin, beta=beta, rt=rt)
@@ -0,0 +1,216 @@
+""" Binary cache of parsed nuclear data files """
+
+# librairies
+
+import os
+import glob
+import json
+import hashlib
+import zipfile
+import threading
+import numpy as np
+
+# cache location (overridden by the FFDD_CACHE_DIR environment variable)
+
+CACHE_ENV = "FFDD_CACHE_DIR"
+
+# maximum size of the results cache on disk (bytes), least recently used are evicted
+
+RESULTS_CACHE_SIZE = 64 * 2**20
+
+_digests = {}
+_digests_lock = threading.Lock()
+
+# cache directory function
+
+
+def cache_dir():
+    """
+    Directory of the FFDD binary caches.
+
+    Returns:
+        path (str): $FFDD_CACHE_DIR if set, else $XDG_CACHE_HOME/ffdd (~/.cache/ffdd).
+    """
+
+    if os.environ.get(CACHE_ENV):
+        return os.environ[CACHE_ENV]
+    xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(xdg, "ffdd")
+
+
+# source file hash function
+
+
+def file_digest(path):
+    """
+    Content hash of a data file.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        digest (str): Short SHA-256 hexadecimal digest of the file content.
+    """
+
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()[:16]
+
+
+# cached arrays loader
+
+
+def cached_arrays(name, source, build):
+    """
+    Arrays parsed from a data file, stored in a binary (.npz) cache created on first use
+    and invalidated when the content of the source file changes.
+
+    Args:
+        name (str): Name of the cache entry.
+        source (str): Path of the source data file.
+        build (callable): Parser of the source file, returning a dict of arrays.
+
+    Returns:
+        arrays (dict): Arrays of the cache entry.
+    """
+
+    # cached version of this exact source file
+
+    digest = file_digest(source)
+    path = os.path.join(cache_dir(), f"{name}-{digest}.npz")
+
+    try:
+        with np.load(path) as npz:
+            return {key: npz[key] for key in npz.files}
+    except (OSError, ValueError, zipfile.BadZipFile):
+        pass # missing or corrupt cache entry is rebuilt
+
+    # parsing and atomic writing (caching is skipped if the directory is not writable)
+
+    arrays = build(source)
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+        for stale in glob.glob(os.path.join(cache_dir(), f"{name}-*.npz")):
+            if stale != path:
+                os.remove(stale)
+    except OSError:
+        pass
+
+    return arrays
+
+
+# memoized source hash function
+
+
+def source_digest(path):
+    """
+    Content hash of a data file, computed once per identity (path, modification
+    time and size) of the file in a process.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        digest (str): Short SHA-256 hexadecimal digest of the file content.
+    """
+
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    with _digests_lock:
+        if key in _digests:
+            return _digests[key]
+
+    digest = file_digest(path)
+    with _digests_lock:
+        _digests[key] = digest
+    return digest
+
+
+# results cache functions
+
+
+def _evict_results(directory, max_bytes):
+    """ Removal of the least recently used results until the cache fits in max_bytes. """
+
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".json"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass # already evicted by another process
+        total -= size
+
+
+def cached_result(name, params, sources, compute, max_bytes = RESULTS_CACHE_SIZE):
+    """
+    Result of a computation, stored on disk (JSON) and keyed by a hash of its parameters
+    and of the content of its source data files. Entries are written atomically (safe for
+    concurrent processes), refreshed on use and evicted least recently used first.
+
+    Args:
+        name (str): Name of the computation.
+        params (dict): Parameters of the computation (JSON serializable).
+        sources (list): Paths of the data files the result depends on.
+        compute (callable): Computation of the result (JSON serializable), without arguments.
+        max_bytes (int): Maximum size of the results cache (bytes).
+
+    Returns:
+        result: Cached or computed result.
+    """
+
+    # key of the result
+
+    key = json.dumps(
+        {"name": name, "params": params, "sources": [source_digest(s) for s in sources]},
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+    directory = os.path.join(cache_dir(), "results")
+    path = os.path.join(directory, f"{name}-{digest}.json")
+
+    try:
+        with open(path) as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        pass
+    else:
+        try:
+            os.utime(path) # most recently used
+        except OSError:
+            pass
+        return result
+
+    # computation, atomic writing and eviction (skipped if the directory is not writable)
+
+    result = compute()
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp, path)
+        _evict_results(directory, max_bytes)
+    except OSError:
+        pass
+
+    return result
@@ -0,0 +1,223 @@
+""" Calibration of the model parameters on reference average neutron multiplicities """
+
+# librairies
+
+import numpy as np
+from collections import namedtuple
+from ffdd.interpolate import interpolate_pairs
+from ffdd.prepared import prepare_fragmentation
+from ffdd.averages import pair_averages
+
+# default starting point and bounds of the calibrated parameters
+
+DEFAULT_PARAMS = {"beta": 0.2, "ekin": 2.0, "rt": 1.0}
+DEFAULT_BOUNDS = {"beta": (0.0, 0.6), "ekin": (0.5, 4.0), "rt": (0.5, 2.0)}
+
+CalibrationResult = namedtuple("CalibrationResult", ["params", "misfit", "n_eval", "converged"])
+
+# energy-independent precomputation of all reference points
+
+
+def _prepare(references, model):
+    """
+    Fragmentations of all reference points, with the terms that do not depend
+    on the calibrated parameters.
+
+    Args:
+        references (dict): Reference data {(A, Z): (energies, nubar[, uncertainties])}.
+        model (str): Energy sharing model ('fong' or 'edigy').
+
+    Returns:
+        prepared (dict): Prepared fragmentations and interpolated probabilities
+        of each target, with the reference values of all points.
+    """
+
+    fragmentations, nu_ref, sigma = [], [], []
+
+    for (a_target, z_target), reference in references.items():
+
+        # fragmentations with yields interpolated at the reference energies
+
+        energies_ref, nu_target = np.atleast_1d(reference[0]), np.atleast_1d(reference[1])
+        sigma_target = np.broadcast_to(reference[2] if len(reference) > 2 else 1.0, nu_target.shape)
+        fragmentation = prepare_fragmentation(a_target, z_target, model)
+        pairs = interpolate_pairs(a_target, z_target, energies_ref)
+
+        fragmentations.append((fragmentation, pairs.energies, pairs.p))
+        nu_ref.extend(nu_target)
+        sigma.extend(sigma_target)
+
+    return {
+        "fragmentations": fragmentations,
+        "nu_ref": np.array(nu_ref, dtype=float),
+        "sigma": np.array(sigma, dtype=float),
+    }
+
+
+def _nubar_points(prepared, beta, ekin, rt):
+    """
+    Average neutron multiplicities of all reference points.
+
+    Args:
+        prepared (dict): Precomputed arrays (see _prepare).
+        beta (float): Average quadrupolar deformation of fragments.
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+        rt (float): Anisothermal coefficient.
+
+    Returns:
+        nubar (float array): Average total number of emitted neutrons of each point.
+    """
+
+    return np.concatenate([
+        pair_averages(fragmentation, energies, p, ekin=ekin, beta=beta, rt=rt).nubar
+        for fragmentation, energies, p in prepared["fragmentations"]
+    ])
+
+
+# derivative-free minimizer
+
+
+def _nelder_mead(func, x0, bounds, max_iter=200, xtol=1e-4, ftol=1e-8):
+    """
+    Nelder-Mead simplex minimization within bounds (points are clipped to the bounds).
+
+    Args:
+        func (callable): Function of a parameters array.
+        x0 (float array): Starting point.
+        bounds (float array): Lower and upper bounds, shape (n, 2).
+        max_iter (int): Maximum number of iterations.
+        xtol (float): Convergence tolerance on the simplex size (relative to bounds).
+        ftol (float): Convergence tolerance on the function values.
+
+    Returns:
+        x (float array): Best point.
+        f (float): Function value at the best point.
+        n_eval (int): Number of function evaluations.
+        converged (bool): True if the tolerances were reached.
+    """
+
+    lower, upper = bounds[:, 0], bounds[:, 1]
+    scale = upper - lower
+    n_eval = 0
+
+    def f(x):
+        nonlocal n_eval
+        n_eval += 1
+        return func(np.clip(x, lower, upper))
+
+    # initial simplex: steps of 10% of the bounds
+
+    simplex = [np.clip(x0, lower, upper)]
+    for k in range(x0.size):
+        x = simplex[0].copy()
+        x[k] = x[k] + 0.1 * scale[k] if x[k] + 0.1 * scale[k] <= upper[k] else x[k] - 0.1 * scale[k]
+        simplex.append(x)
+    simplex = np.array(simplex)
+    values = np.array([f(x) for x in simplex])
+
+    converged = False
+    for _ in range(max_iter):
+
+        order = np.argsort(values)
+        simplex, values = simplex[order], values[order]
+        size = np.max(np.abs(simplex[1:] - simplex[0]) / scale)
+        if size < xtol or values[-1] - values[0] < ftol:
+            converged = True
+            break
+
+        # reflection, expansion, contraction and shrink
+
+        centroid = simplex[:-1].mean(axis=0)
+        xr = np.clip(2 * centroid - simplex[-1], lower, upper)
+        fr = f(xr)
+        if fr < values[0]:
+            xe = np.clip(3 * centroid - 2 * simplex[-1], lower, upper)
+            fe = f(xe)
+            simplex[-1], values[-1] = (xe, fe) if fe < fr else (xr, fr)
+        elif fr < values[-2]:
+            simplex[-1], values[-1] = xr, fr
+        else:
+            xc = 0.5 * (centroid + simplex[-1])
+            fc = f(xc)
+            if fc < values[-1]:
+                simplex[-1], values[-1] = xc, fc
+            else:
+                simplex[1:] = 0.5 * (simplex[0] + simplex[1:])
+                values[1:] = [f(x) for x in simplex[1:]]
+
+    best = np.argmin(values)
+    return simplex[best], values[best], n_eval, converged
+
+
+# calibration of the model parameters
+
+
+def calibrate(references, params = ('beta', 'ekin', 'rt'), x0 = None, bounds = None,
+              fixed = None, model = 'fong', max_iter = 200):
+    """
+    Calibration of beta, ekin and rt on reference average neutron multiplicities
+    of one or several targets, by minimization of the weighted misfit
+    mean(((nubar - nubar_ref) / sigma)^2) with a derivative-free (Nelder-Mead) method.
+    The model is evaluated at the reference energies with the yields interpolated
+    between the available incident energies.
+
+    Args:
+        references (dict): Reference data {(A, Z): (energies, nubar)} or
+        {(A, Z): (energies, nubar, uncertainties)}, energies in MeV.
+        params (tuple): Calibrated parameters among 'beta', 'ekin' and 'rt'.
+        x0 (dict): Starting values of the calibrated parameters.
+        bounds (dict): Bounds (min, max) of the calibrated parameters.
+        fixed (dict): Values of the parameters which are not calibrated.
+        model (str): Energy sharing model ('fong' or 'edigy').
+        max_iter (int): Maximum number of iterations.
+
+    Returns:
+        result (CalibrationResult): Calibrated parameters (dict of all parameters),
+        misfit, number of model evaluations and convergence flag.
+
+    Raises:
+        ValueError: If a parameter name is unknown, a parameter is both fixed
+        and calibrated (or given a starting value), the calibrated parameters are
+        empty or repeated, bounds are not increasing or a starting value is out of bounds.
+    """
+
+    fixed, x0, bounds = dict(fixed or {}), dict(x0 or {}), dict(bounds or {})
+    for name in [*params, *fixed, *x0, *bounds]:
+        if name not in DEFAULT_PARAMS:
+            raise ValueError(f"ERROR: Unknown parameter '{name}' (beta, ekin or rt).")
+    for name in fixed:
+        if name in x0 or name in params:
+            raise ValueError(f"ERROR: Parameter '{name}' is both fixed and calibrated.")
+
+    if len(params) == 0 or len(set(params)) != len(params):
+        raise ValueError(
+            f"ERROR: Calibrated parameters {tuple(params)} must be distinct and not empty."
+        )
+
+    values = dict(DEFAULT_PARAMS, **fixed, **x0)
+    bounds = dict(DEFAULT_BOUNDS, **bounds)
+    for name in params:
+        lower, upper = bounds[name]
+        if not lower < upper:
+            raise ValueError(
+                f"ERROR: Bounds ({lower}, {upper}) of parameter '{name}' are not increasing."
+            )
+        if not lower <= values[name] <= upper:
+            raise ValueError(
+                f"ERROR: Starting value {values[name]} of parameter '{name}' is out of its bounds."
+            )
+
+    prepared = _prepare(references, model)
+
+    def misfit(x):
+        values.update(zip(params, x))
+        nu = _nubar_points(prepared, values["beta"], values["ekin"], values["rt"])
+        return float(np.mean(((nu - prepared["nu_ref"]) / prepared["sigma"]) ** 2))
+
+    limits = np.array([bounds[name] for name in params], dtype=float)
+    x, f, n_eval, converged = _nelder_mead(
+        misfit, np.array([values[name] for name in params], dtype=float), limits, max_iter=max_iter
+    )
+    values.update(zip(params, np.clip(x, limits[:, 0], limits[:, 1])))
+
+    return CalibrationResult({k: float(v) for k, v in values.items()}, float(f), n_eval, converged)
@@ -0,0 +1,147 @@
+""" Neutron decay cascades of excited nuclei """
+
+# librairies
+
+import numpy as np
+from functools import lru_cache
+from ffdd.sepn import sepn, load_s1n_table
+from ffdd import kernels
+
+# decay of a fission fragment
+
+def decay(a, z, xe, ekin):
+    """
+    Decay of an excited nucleus by neutron emissions.
+
+    Args:
+        a (int): Mass number of the nucleus.
+        z (int): Charge number of the nucleus.
+        xe (float): Excitation energy of the nucleus (MeV). 
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+    
+    Returns:
+        nu (int): Number of emitted neutrons.
+        xe (float): Residual excitation energy (MeV).
+    """
+
+    # init
+
+    nu = 0
+    sn = sepn(a, z)
+
+    # sequential neutron evaporation
+
+    while xe > sn:
+        nu += 1
+        a -= 1
+        xe -= sn + ekin
+        sn = sepn(a, z)
+
+    return nu, xe
+
+# cumulative neutron emission thresholds of all nuclei
+
+CHUNK_SIZE = 1 << 16
+
+# threshold tables kept in memory (~8.5 MB each, one per value of ekin): the current
+# and previous values only, older tables are not reused while ekin is calibrated
+
+THRESHOLD_TABLES = 2
+
+
+@lru_cache(maxsize=THRESHOLD_TABLES)
+def threshold_table(ekin, n_steps = 16):
+    """
+    Cumulative neutron emission thresholds of all the nuclei of the (Z, N) table.
+
+    Args:
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+        n_steps (int): Maximum number of emissions in the table.
+
+    Returns:
+        thresholds (float array): Read-only array of shape (Z, N, n_steps), thresholds[z, n, k]
+        is the excitation energy (MeV) above which nucleus (Z, N) emits more than k neutrons
+        (inf when the cascade stops on an unknown separation energy).
+        costs (float array): Read-only array of shape (Z, N, n_steps+1), costs[z, n, k] is
+        the excitation energy (MeV) removed by the emission of k neutrons.
+    """
+
+    s1n_table = load_s1n_table()
+    n_z, n_n = s1n_table.shape
+    thresholds = np.empty((n_z, n_n, n_steps))
+    costs = np.zeros((n_z, n_n, n_steps + 1))
+
+    # separation energy of the residual nucleus after k emissions: S1n(Z, N-k)
+
+    sn = s1n_table.copy()
+
+    for k in range(n_steps):
+        thresholds[:, :, k] = costs[:, :, k] + sn
+        costs[:, :, k + 1] = costs[:, :, k] + (sn + ekin)
+        sn[:, 1:] = sn[:, :-1]
+        sn[:, 0] = np.nan
+
+    # unknown separation energies stop the cascade, thresholds must be passed in order
+
+    thresholds[np.isnan(thresholds)] = np.inf
+    thresholds = np.maximum.accumulate(thresholds, axis=2)
+
+    thresholds.flags.writeable = False
+    costs.flags.writeable = False
+    return thresholds, costs
+
+
+# decay of many fission fragments with threshold tables
+
+
+def decay_many(a, z, xe, ekin):
+    """
+    Decay of many excited nuclei by neutron emissions, using the
+    cumulative emission thresholds of each nucleus (see threshold_table).
+
+    Args:
+        a (int array): Mass numbers of the nuclei.
+        z (int array): Charge numbers of the nuclei.
+        xe (float array): Excitation energies of the nuclei (MeV).
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+
+    Returns:
+        nu (int array): Numbers of emitted neutrons.
+        xe (float array): Residual excitation energies (MeV).
+    """
+
+    a, z, xe = np.broadcast_arrays(
+        np.asarray(a, dtype=int), np.asarray(z, dtype=int), np.asarray(xe, dtype=float)
+    )
+    shape = a.shape
+    z, n, xe = z.ravel(), (a - z).ravel(), xe.ravel()
+
+    # compiled cascade, one nucleus at a time (Numba installed)
+
+    if kernels.ENABLED:
+        nu, residual = kernels.cascade(z, n, xe, load_s1n_table(), ekin)
+        return nu.reshape(shape), residual.reshape(shape)
+
+    nu = np.zeros(xe.size, dtype=int)
+    residual = xe.copy()
+
+    # nuclei outside of the table do not emit
+
+    n_z, n_n = load_s1n_table().shape
+    inside = np.flatnonzero((z >= 0) & (z < n_z) & (n >= 0) & (n < n_n))
+
+    # number of thresholds passed, with a larger table if the cascade is not over
+
+    n_steps = 16
+    while True:
+        thresholds, costs = threshold_table(float(ekin), n_steps)
+        for start in range(0, inside.size, CHUNK_SIZE):
+            k = inside[start:start + CHUNK_SIZE]
+            nu[k] = np.sum(thresholds[z[k], n[k]] < xe[k, None], axis=1)
+        if not np.any(nu[inside] == n_steps):
+            break
+        n_steps *= 2
+
+    residual[inside] -= costs[z[inside], n[inside], nu[inside]]
+
+    return nu.reshape(shape), residual.reshape(shape)
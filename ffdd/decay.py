@@ -3,46 +3,54 @@
 # librairies
 
 import numpy as np
-from ffdd.sepn import sepn
-from ffdd.yields import read_fission_yields, fission_fragments_coupled
-from ffdd.tke import tke
-from ffdd.energy import q_value, txe_sharing
+from ffdd.cache import cached_result
+from ffdd.mass import _datafile as _mass_file
+from ffdd.sepn import _datafile as _sepn_file
+from ffdd.yields import FF_COUPLED_DTYPE, read_fission_pairs, _yields_file
+from ffdd.observables import NubarResult
+from ffdd.cascade import decay, decay_many
+from ffdd.prepared import PreparedFragmentation, prepare_fragmentation
+from ffdd.averages import fission_averages
 
-# decay of a fission fragment
+# public functions (decay cascades re-exported from ffdd.cascade)
 
-def decay(a, z, xe, ekin):
+__all__ = ["decay", "decay_many", "multiplicities", "nubar", "nubar_results"]
+
+# neutron emissions for a whole table of fragmentations
+
+def multiplicities(a_target, z_target, energy, ah, zh, al, zl,
+                   ekin = 2.0, beta = 0.2, model = 'fong', rt = 1):
     """
-    Decay of an excited nucleus by neutron emissions.
+    Neutron emissions of all fragmentations of a fission at a given incident energy
+    (see PreparedFragmentation for tables reused over several energies).
 
     Args:
-        a (int): Mass number of the nucleus.
-        z (int): Charge number of the nucleus.
-        xe (float): Excitation energy of the nucleus (MeV). 
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        energy (float): Incident neutron energy (MeV).
+        ah (int array): Mass numbers of the heavy fragments.
+        zh (int array): Charge numbers of the heavy fragments.
+        al (int array): Mass numbers of the light fragments.
+        zl (int array): Charge numbers of the light fragments.
         ekin (float): Average kinetic energy of emitted neutrons (MeV).
-    
+        beta (float): Average quadrupolar deformation of fragments.
+        model (str): Energy sharing model ('fong' or 'edigy').
+        rt (float): Anisothermal coefficient.
+
     Returns:
-        nu (int): Number of emitted neutrons.
-        xe (float): Residual excitation energy (MeV).
+        nuh (int array): Number of neutrons emitted by the heavy fragments.
+        nul (int array): Number of neutrons emitted by the light fragments.
+        valid (bool array): Fragmentations with all the required masses available.
     """
 
-    # init
-
-    nu = 0
-    sn = sepn(a, z)
-
-    # sequential neutron evaporation
+    prepared = PreparedFragmentation.from_fragments(a_target, z_target, ah, zh, al, zl, model=model)
+    return prepared.multiplicities(energy, ekin=ekin, beta=beta, rt=rt)
 
-    while xe > sn:
-        nu += 1
-        a -= 1
-        xe -= sn + ekin
-        sn = sepn(a, z)
+# average neutron emissions in fission (version of the model in the results cache keys)
 
-    return nu, xe
+NUBAR_CACHE_VERSION = 4
 
-# average neutron emissions in fission
-
-def nubar(a_target, z_target, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1):
+def nubar(a_target, z_target, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1, cache = False):
     """
     Average neutron multiplicity in fission.
 
@@ -53,66 +61,73 @@ def nubar(a_target, z_target, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1):
         beta (float): Average quadrupolar deformation of fragments. 
         model (str): Energy sharing model ('fong' or 'edigy'). 
         rt (float): Anisothermal coefficient. 
+        cache (bool): Store and reuse the result in the results cache on disk
+        (keyed by the parameters and the content of the nuclear data files).
     
     Returns:
         energies (float list): incident energies available in the literature (MeV).
         nubar_vs_energy (float list): average total number of emitted neutrons for each energy.
     """
 
-    # scan of available incident energies
-
-    energies, nfys = read_fission_yields(a_target, z_target)
-    nubar_vs_energy = []
+    # result of a previous run with the same parameters and nuclear data
 
-    # loop on available incident energies
+    if cache:
+        params = {
+            "version": NUBAR_CACHE_VERSION,
+            "a_target": int(a_target), "z_target": int(z_target),
+            "ekin": float(ekin), "beta": float(beta), "model": str(model), "rt": float(rt),
+        }
+        sources = [_yields_file(a_target, z_target), _mass_file, _sepn_file]
 
-    for k in range(len(energies)):
+        def compute():
+            energies, nu = nubar(a_target, z_target, ekin=ekin, beta=beta, model=model, rt=rt)
+            return [list(energies), [float(n) for n in nu]]
 
-        total_proba = 0
-        nu_list, proba_list = [], []
-        energy = energies[k]
-        nfy = nfys[k]
+        energies, nubar_vs_energy = cached_result("nubar", params, sources, compute)
+        return energies, nubar_vs_energy
 
-        # scan of fragmentations for one given incident energy
-        
-        for ah, zh, al, zl, proba in fission_fragments_coupled(a_target, z_target, nfy):
+    # average over the fragmentations of all incident energies at once
 
-            # fragments masses and separation energies from data
+    averages = fission_averages(a_target, z_target, ekin=ekin, beta=beta, model=model, rt=rt)
 
-            try:
-                q = q_value(a_target, z_target, ah, zh, al, zl, energy)
-                total_proba += proba
+    return averages.energies.tolist(), averages.nubar.tolist()
 
-            except KeyError:
-                continue
 
-            # energy balance for this fragmentation
-            
-            tke_ff = tke(ah, zh, al, zl, beta)
-            txe = q - tke_ff
+# neutron emissions observables in fission
 
-            # excitation energy sharing between fragments
-
-            try:   
-                xeh, xel = txe_sharing(txe, ah, zh, al, zl, model=model, rt=rt)
-
-            except KeyError:
-                continue
+def nubar_results(a_target, z_target, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1):
+    """
+    Neutron emissions observables in fission: average multiplicity, P(nu),
+    nu(A), nu(Z) and heavy/light sharing, from a single evaluation.
 
-            # neutron decay cascade of the excited fragments
+    Args:
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+        beta (float): Average quadrupolar deformation of fragments.
+        model (str): Energy sharing model ('fong' or 'edigy').
+        rt (float): Anisothermal coefficient.
 
-            nuh, _ = decay(ah, zh, xeh, ekin=ekin)
-            nul, _ = decay(al, zl, xel, ekin=ekin)
+    Returns:
+        energies (float list): incident energies available in the literature (MeV).
+        results (NubarResult list): neutron emissions of all fragmentations for each energy.
+    """
 
-            # total emissions by the two fragments
+    pairs = read_fission_pairs(a_target, z_target)
+    prepared = prepare_fragmentation(a_target, z_target, model)
+    nuh, nul, valid = prepared.multiplicities(pairs.energies[:, None], ekin=ekin, beta=beta, rt=rt)
+    results = []
 
-            nu = nuh + nul
-            nu_list.append(nu)
-            proba_list.append(proba)
-            
-        # average decay of fission over all fragmentations
+    # fragmentations listed at each incident energy
 
-        proba_list = np.array(proba_list) / total_proba
-        nubar_vs_energy.append(np.average(nu_list, weights = proba_list))
+    for k, energy in enumerate(pairs.energies.tolist()):
+        listed = pairs.p[k] > 0
+        ff = np.empty(np.count_nonzero(listed), dtype=FF_COUPLED_DTYPE)
+        for name in ("ah", "zh", "al", "zl"):
+            ff[name] = getattr(pairs, name)[listed]
+        ff["p"] = pairs.p[k, listed]
+        results.append(
+            NubarResult.from_fragments(energy, ff, nuh[k, listed], nul[k, listed], valid[k, listed])
+        )
 
-    return energies, nubar_vs_energy
+    return pairs.energies.tolist(), results
@@ -0,0 +1,105 @@
+""" Streaming reader of ENDF-6 fission product yields sublibraries (MF=8, MT=454) """
+
+# librairies
+
+import re
+import numpy as np
+
+# ENDF-6 record layout
+
+FIELD_WIDTH = 11
+FIELDS_PER_LINE = 6
+MF_YIELDS = 8
+MT_INDEPENDENT = 454
+
+# one record per fission product and incident energy
+
+NFY_RECORD_DTYPE = np.dtype(
+    [("energy", float), ("za", int), ("isomer", int), ("yield", float), ("unc", float)]
+)
+
+# ENDF floats omit the exponent letter (e.g. 2.530000-2)
+
+_EXPONENT = re.compile(r"(?<=[0-9.])([+-])(?=[0-9])")
+
+# parser of one line
+
+
+def _fields(line):
+    """
+    Numerical fields of an ENDF-6 line (blank fields are zeros).
+
+    Args:
+        line (str): ENDF-6 line.
+
+    Returns:
+        fields (list): The six floats of the line.
+    """
+
+    fields = []
+    for k in range(FIELDS_PER_LINE):
+        raw = line[k * FIELD_WIDTH:(k + 1) * FIELD_WIDTH].strip()
+        fields.append(float(_EXPONENT.sub(r"e\1", raw)) if raw else 0.0)
+    return fields
+
+
+# streaming reader of fission yields records
+
+
+def iter_nfy_records(filepath, mt=MT_INDEPENDENT):
+    """
+    Streaming reader of the fission product yields of an ENDF-6 file.
+
+    Args:
+        filepath (str): Path of the ENDF file.
+        mt (int): Section of the yields (454: independent, 459: cumulative).
+
+    Yields:
+        energy (float): Incident energy (eV).
+        za (int): Fission product identifier (1000*Z + A).
+        isomer (int): Isomeric state of the fission product.
+        yield (float): Fission yield.
+        unc (float): Uncertainty of the fission yield.
+    """
+
+    tag = f"{MF_YIELDS:2d}{mt:3d}"
+
+    with open(filepath) as f:
+
+        lines = (line for line in f if line[70:75] == tag)
+
+        # HEAD record: number of incident energies
+
+        head = next(lines, None)
+        if head is None:
+            raise ValueError(f"ERROR: No MF={MF_YIELDS}, MT={mt} section in {filepath}.")
+        n_energies = int(_fields(head)[2])
+
+        # one LIST record per incident energy: NFP quadruplets (ZAFP, FPS, Y, DY)
+
+        for _ in range(n_energies):
+            energy, _, _, _, npl, nfp = _fields(next(lines))
+            values = []
+            while len(values) < npl:
+                values.extend(_fields(next(lines)))
+            for j in range(int(nfp)):
+                za, isomer, y, dy = values[4 * j:4 * j + 4]
+                yield energy, int(za), int(isomer), y, dy
+
+
+# reader of fission yields records into arrays
+
+
+def read_nfy_records(filepath, mt=MT_INDEPENDENT):
+    """
+    Reader of the fission product yields of an ENDF-6 file into arrays.
+
+    Args:
+        filepath (str): Path of the ENDF file.
+        mt (int): Section of the yields (454: independent, 459: cumulative).
+
+    Returns:
+        records (array): Records of NFY_RECORD_DTYPE (energy in eV, za, isomer, yield, unc).
+    """
+
+    return np.fromiter(iter_nfy_records(filepath, mt), dtype=NFY_RECORD_DTYPE)
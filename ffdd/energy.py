@@ -2,9 +2,18 @@
 
 # librairies
 
-from ffdd.mass import nuclear_mass
-from ffdd.sepn import sepn
-from ffdd.utils import NEUTRON_MASS
+import numpy as np
+from functools import lru_cache
+from ffdd.mass import nuclear_mass, nuclear_mass_array, load_mass_table
+from ffdd.sepn import sepn, sepn_array
+from ffdd.utils import NEUTRON_MASS, table_lookup
+from ffdd import kernels
+
+# von Edigy/BSGF model parameters
+
+EDIGY_P = 0.1271
+EDIGY_Q = 4.9813e-3
+EDIGY_R = -8.9553e-5
 
 # Q-value for neutron-induced fission
 
@@ -40,6 +49,40 @@ def q_value(a, z, ah, zh, al, zl, energy):
     return q
 
 
+# vectorized Q-value for neutron-induced fission
+
+
+def q_value_array(a, z, ah, zh, al, zl, energy):
+    """
+    Vectorized Q-value of neutron-induced fission.
+
+    Args:
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+        ah (int array): Mass numbers of the heavy fragments.
+        zh (int array): Charge numbers of the heavy fragments.
+        al (int array): Mass numbers of the light fragments.
+        zl (int array): Charge numbers of the light fragments.
+        energy (float): Incident neutron energy (MeV).
+
+    Returns:
+        q (float array): Q-values (MeV), NaN if a fragment mass is not available.
+    """
+
+    # fission properties
+
+    m = nuclear_mass(a, z)
+    sn = sepn(a, z)
+    mh = nuclear_mass_array(ah, zh)
+    ml = nuclear_mass_array(al, zl)
+
+    # q-value definition
+
+    q = m + NEUTRON_MASS + sn + energy - mh - ml
+
+    return q
+
+
 # Fong model for excitation energy sharing between fragments
 
 
@@ -80,9 +123,7 @@ def edigy(ah, zh, al, zl):
 
     # von Edigy/BSGF model parameters
 
-    p = 0.1271
-    q = 4.9813e-3
-    r = -8.9553e-5
+    p, q, r = EDIGY_P, EDIGY_Q, EDIGY_R
 
     # heavy fragment
 
@@ -97,7 +138,7 @@ def edigy(ah, zh, al, zl):
     )
     if ah % 2 == 0 and zh % 2 == 0:  # even-even nucleus
         deltah = 0.5 * pdh
-    elif ah % 2 == 1 and zh % 2 == 1:  # odd-odd nucleus
+    elif ah % 2 == 1 and zh % 2 == 1:  # odd A and odd Z
         deltah = - 0.5 * pdh
     else:
         deltah = 0
@@ -117,7 +158,7 @@ def edigy(ah, zh, al, zl):
     )
     if al % 2 == 0 and zl % 2 == 0:  # even-even nucleus
         deltal = 0.5 * pdl
-    elif ah % 2 == 1 and zh % 2 == 1:  # odd-odd nucleus
+    elif ah % 2 == 1 and zh % 2 == 1:  # odd A and odd Z of the heavy fragment
         deltal = - 0.5 * pdl
     else:
         deltal = 0
@@ -130,6 +171,139 @@ def edigy(ah, zh, al, zl):
     return x
 
 
+# level density parameters of all nuclei (von Edigy/BSGF model)
+
+
+@lru_cache(maxsize=1)
+def level_density_table():
+    """
+    Pairing corrections and level density parameters of the von Edigy (BSGF)
+    model for all the nuclei of the (Z, N) mass table. As in edigy, the pairing
+    correction of a fragment which is not even-even depends on the parities of
+    the heavy fragment of its fragmentation: both tables have a first index 1 if
+    the heavy fragment has an odd A and an odd Z, 0 otherwise.
+
+    Returns:
+        delta (float array): Read-only (2, Z, N) table of pairing corrections (MeV),
+        NaN if a neighbouring mass is not available.
+        d (float array): Read-only (2, Z, N) table of d = A (p + q (S1n - delta) + r A),
+        NaN if not available.
+    """
+
+    z, n = np.indices(load_mass_table().shape)
+    a = z + n
+
+    # pairing deltas from the masses of (A+2, Z+1) and (A-2, Z-1) neighbours
+
+    pd = (
+        0.5
+        * np.where(z % 2 == 0, 1.0, -1.0)
+        * (
+            -nuclear_mass_array(a + 2, z + 1)
+            + 2 * nuclear_mass_array(a, z)
+            - nuclear_mass_array(a - 2, z - 1)
+        )
+    )
+    even_even = (a % 2 == 0) & (z % 2 == 0)
+    delta = np.array([
+        np.where(even_even, 0.5 * pd, 0.0 * pd),
+        np.where(even_even, 0.5 * pd, -0.5 * pd),
+    ])
+
+    # level density parameter
+
+    s = sepn_array(a, z) - delta
+    d = a * (EDIGY_P + EDIGY_Q * s + EDIGY_R * a)
+
+    delta.flags.writeable = False
+    d.flags.writeable = False
+    return delta, d
+
+
+# vectorized von Edigy model for excitation energy sharing between fragments
+
+
+def edigy_array(ah, zh, al, zl):
+    """
+    Vectorized von Edigy (BSGF) model for excitation energy sharing between fragments,
+    from the tabulated level density parameters (see level_density_table).
+
+    Args:
+        ah (int array): Mass numbers of the heavy fragments.
+        zh (int array): Charge numbers of the heavy fragments.
+        al (int array): Mass numbers of the light fragments.
+        zl (int array): Charge numbers of the light fragments.
+
+    Returns:
+        x (float array): Excitation energy sharing factors, NaN if a mass is not available.
+    """
+
+    ah, zh = np.asarray(ah, dtype=int), np.asarray(zh, dtype=int)
+    al, zl = np.asarray(al, dtype=int), np.asarray(zl, dtype=int)
+
+    # level density parameters of the pairing corrections selected by the heavy fragment
+
+    _, d = level_density_table()
+    heavy_odd = (ah % 2 == 1) & (zh % 2 == 1)
+    dh = np.where(heavy_odd, table_lookup(d[1], zh, ah - zh), table_lookup(d[0], zh, ah - zh))
+    dl = np.where(heavy_odd, table_lookup(d[1], zl, al - zl), table_lookup(d[0], zl, al - zl))
+
+    # sharing factor
+
+    x = dl / (dl + dh)
+    return x
+
+
+# excitation energy sharing factor of a model
+
+SHARING_MODELS = ("fong", "edigy")
+
+
+def check_sharing_model(model):
+    """
+    Validation of the name of an energy sharing model.
+
+    Args:
+        model (str): Model for excitation energy sharing.
+
+    Raises:
+        ValueError: If the model is not 'fong' or 'edigy'.
+    """
+
+    if model not in SHARING_MODELS:
+        raise ValueError(
+            f"ERROR: Unknown energy sharing model '{model}' ({' or '.join(SHARING_MODELS)})."
+        )
+
+
+def sharing_factor(ah, zh, al, zl, model="fong"):
+    """
+    Excitation energy sharing factor of an energy sharing model, with the scalar
+    models for scalar fragments and the vectorized models for arrays.
+
+    Args:
+        ah (int or int array): Mass number(s) of the heavy fragment(s).
+        zh (int or int array): Charge number(s) of the heavy fragment(s).
+        al (int or int array): Mass number(s) of the light fragment(s).
+        zl (int or int array): Charge number(s) of the light fragment(s).
+        model (str): Model for excitation energy sharing ('fong' or 'edigy').
+
+    Returns:
+        x (float or float array): Excitation energy sharing factor(s) of the light fragment(s).
+
+    Raises:
+        ValueError: If the model is not 'fong' or 'edigy'.
+    """
+
+    check_sharing_model(model)
+    scalar = np.ndim(ah) == 0
+
+    if model == "fong":
+        return fong(ah, al) if scalar else fong(np.asarray(ah), np.asarray(al))
+
+    return edigy(ah, zh, al, zl) if scalar else edigy_array(ah, zh, al, zl)
+
+
 # excitation energy sharing between fragments
 
 
@@ -153,11 +327,7 @@ def txe_sharing(txe, ah, zh, al, zl, model="fong", rt=1.0):
 
     # energy partition factor
 
-    if model == "fong":
-        x = fong(ah, al)
-
-    elif model == "edigy":
-        x = edigy(ah, zh, al, zl)
+    x = sharing_factor(ah, zh, al, zl, model)
 
     # thermal equilibrium
 
@@ -169,3 +339,43 @@ def txe_sharing(txe, ah, zh, al, zl, model="fong", rt=1.0):
     xeh = (1 - x) * txe
 
     return xeh, xel
+
+
+# vectorized excitation energy sharing between fragments
+
+
+def txe_sharing_array(txe, ah, zh, al, zl, model="fong", rt=1.0):
+    """
+    Vectorized sharing of the Total Excitation Energy between the two fission fragments.
+
+    Args:
+        txe (float array): Total Excitation Energies (MeV).
+        ah (int array): Mass numbers of the heavy fragments.
+        zh (int array): Charge numbers of the heavy fragments.
+        al (int array): Mass numbers of the light fragments.
+        zl (int array): Charge numbers of the light fragments.
+        model (str): Model for excitation energy sharing ('fong' or 'edigy').
+        rt (float): Anisothermal factor.
+
+    Returns:
+        xeh (float array): Excitation energies of the heavy fragments (MeV).
+        xel (float array): Excitation energies of the light fragments (MeV).
+    """
+
+    # energy partition factor
+
+    x = sharing_factor(np.asarray(ah), np.asarray(zh), np.asarray(al), np.asarray(zl), model)
+
+    # thermal equilibrium
+
+    x = pow(rt, 2) * x
+
+    # excitation energy partition (compiled kernel if Numba is installed)
+
+    if kernels.ENABLED:
+        return kernels.sharing(txe, x)
+
+    xel = x * txe
+    xeh = (1 - x) * txe
+
+    return xeh, xel
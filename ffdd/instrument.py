@@ -0,0 +1,120 @@
+""" Opt-in timing and counters instrumentation of the nubar computation """
+
+# librairies
+
+import time
+from contextlib import contextmanager, nullcontext
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+# active instrumentations (nothing is measured when empty)
+
+_active = []
+_disabled = nullcontext()
+
+# statistics of an instrumentation
+
+
+@dataclass
+class NubarStats:
+    """
+    Wall time per stage and counters of the nubar computation.
+
+    Attributes:
+        times (dict): Wall time (s) of each stage ('read', 'coupling', 'q_value', 'tke',
+        'sharing', 'cascade'), the first four only when the evaluation is not already
+        in the LRU cache (see yields_cache_info).
+        counts (dict): Counters ('fragmentations', 'skipped_q_value', 'skipped_sharing',
+        'zero_emission').
+    """
+
+    times: dict = field(default_factory=lambda: defaultdict(float))
+    counts: dict = field(default_factory=lambda: defaultdict(int))
+
+    def report(self):
+        """
+        Human-readable summary of the statistics.
+
+        Returns:
+            str: One line per stage and counter.
+        """
+
+        lines = [f"{name:16s} {1e3 * t:10.3f} ms" for name, t in self.times.items()]
+        lines += [f"{name:16s} {n:10d}" for name, n in self.counts.items()]
+        return "\n".join(lines)
+
+
+# instrumentation context manager
+
+
+@contextmanager
+def instrument(callback = None):
+    """
+    Instrumentation of the nubar computations run inside the context.
+
+    Args:
+        callback (callable): Function called with the NubarStats when the context exits.
+
+    Yields:
+        stats (NubarStats): Statistics, filled while the context is active.
+    """
+
+    stats = NubarStats()
+    _active.append(stats)
+    try:
+        yield stats
+    finally:
+        _active.remove(stats)
+        if callback is not None:
+            callback(stats)
+
+
+# hooks used by the computation
+
+
+def enabled():
+    """ True if an instrumentation is active. """
+    return bool(_active)
+
+
+class _Stage:
+    """ Timer of a stage for all active instrumentations. """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        for stats in _active:
+            stats.times[self.name] += elapsed
+        return False
+
+
+def stage(name):
+    """
+    Timer of a stage of the computation (a shared no-op when nothing is instrumented).
+
+    Args:
+        name (str): Name of the stage.
+
+    Returns:
+        Context manager.
+    """
+
+    return _Stage(name) if _active else _disabled
+
+
+def count(name, n):
+    """
+    Increment a counter of all active instrumentations.
+
+    Args:
+        name (str): Name of the counter.
+        n (int): Increment.
+    """
+
+    for stats in _active:
+        stats.counts[name] += int(n)
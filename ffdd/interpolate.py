@@ -0,0 +1,117 @@
+""" Interpolation of fission yields between tabulated incident energies """
+
+# librairies
+
+import numpy as np
+from ffdd.yields import FF_COUPLED_DTYPE, read_fission_pairs
+from ffdd.prepared import prepare_fragmentation
+from ffdd.averages import pair_averages
+
+# interpolation weights
+
+
+def interpolation_weights(energies, grid):
+    """
+    Linear interpolation weights between tabulated incident energies (constant
+    beyond the tabulated range).
+
+    Args:
+        energies (float array): Tabulated incident energies (MeV), increasing.
+        grid (float array): Incident energies to interpolate (MeV).
+
+    Returns:
+        lower (int array): Index of the tabulated energy below each grid energy.
+        upper (int array): Index of the tabulated energy above each grid energy.
+        w (float array): Weight of the upper tabulated energy.
+    """
+
+    energies = np.asarray(energies, dtype=float)
+    grid = np.clip(np.asarray(grid, dtype=float), energies[0], energies[-1])
+
+    if energies.size == 1:
+        zeros = np.zeros(grid.shape, dtype=int)
+        return zeros, zeros, np.zeros(grid.shape)
+
+    upper = np.clip(np.searchsorted(energies, grid, side="right"), 1, energies.size - 1)
+    lower = upper - 1
+    w = (grid - energies[lower]) / (energies[upper] - energies[lower])
+
+    return lower, upper, w
+
+
+def interpolate_pairs(a, z, grid):
+    """
+    Fragmentation probabilities of a target nucleus interpolated on an energy grid.
+
+    Args:
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+        grid (float array): Incident energies (MeV).
+
+    Returns:
+        pairs (FissionPairs): Fragmentations of the target, with probabilities
+        p (grid energies x pairs) interpolated on the grid.
+    """
+
+    pairs = read_fission_pairs(a, z)
+    grid = np.atleast_1d(np.asarray(grid, dtype=float))
+    lower, upper, w = interpolation_weights(pairs.energies, grid)
+    p = (1 - w[:, None]) * pairs.p[lower] + w[:, None] * pairs.p[upper]
+
+    return pairs._replace(energies=grid, p=p)
+
+
+# coupled fission fragments at any incident energy
+
+
+def interpolate_fission_fragments_coupled(a, z, energy):
+    """
+    Coupled fission fragments of a target nucleus at any incident energy,
+    linearly interpolated between the tabulated energies.
+
+    Args:
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+        energy (float): Incident neutron energy (MeV).
+
+    Returns:
+        ff (array): Coupled fission fragments with a non-zero probability,
+        array of FF_COUPLED_DTYPE (fields ah, zh, al, zl and p).
+    """
+
+    pairs = interpolate_pairs(a, z, energy)
+    p = pairs.p[0]
+    k = np.flatnonzero(p > 0)
+
+    ff = np.empty(k.size, dtype=FF_COUPLED_DTYPE)
+    ff["ah"], ff["zh"], ff["al"], ff["zl"] = pairs.ah[k], pairs.zh[k], pairs.al[k], pairs.zl[k]
+    ff["p"] = p[k]
+
+    return ff
+
+
+# average neutron emissions on an energy grid
+
+
+def nubar_interpolated(a_target, z_target, grid, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1):
+    """
+    Average neutron multiplicity in fission on any grid of incident energies,
+    with the yields linearly interpolated between the tabulated energies.
+
+    Args:
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        grid (float array): Incident energies (MeV).
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+        beta (float): Average quadrupolar deformation of fragments.
+        model (str): Energy sharing model ('fong' or 'edigy').
+        rt (float): Anisothermal coefficient.
+
+    Returns:
+        nubar (float array): Average total number of emitted neutrons for each energy of the grid.
+    """
+
+    pairs = interpolate_pairs(a_target, z_target, grid)
+    prepared = prepare_fragmentation(a_target, z_target, model)
+
+    return pair_averages(prepared, pairs.energies, pairs.p, ekin=ekin, beta=beta, rt=rt).nubar
@@ -0,0 +1,160 @@
+""" Optional compiled kernels (Numba) of the decay cascade, TKE and energy sharing """
+
+# librairies
+
+import os
+import functools
+import importlib.util
+import numpy as np
+from ffdd.utils import COULOMB_CST, NUCLEAR_RADIUS_R0
+
+# kernels are used when Numba is installed (disabled by FFDD_NUMBA=0)
+
+NUMBA_ENV = "FFDD_NUMBA"
+
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+ENABLED = HAVE_NUMBA and os.environ.get(NUMBA_ENV, "1") != "0"
+
+# compilation of the kernels
+
+
+def _jit(func):
+    """ Kernel compiled by Numba on first call (plain Python function without Numba). """
+
+    if not HAVE_NUMBA:
+        return func
+
+    compiled = None
+
+    @functools.wraps(func)
+    def kernel(*args):
+        nonlocal compiled
+        if compiled is None:
+            import numba
+            compiled = numba.njit(cache=True, nogil=True)(func)
+        return compiled(*args)
+
+    return kernel
+
+
+# loops over nuclei (same floating-point operations as the NumPy implementations)
+
+
+@_jit
+def _cascade(z, n, xe, s1n, ekin, nu, residual):
+    n_z, n_n = s1n.shape
+    for i in range(xe.size):
+        nu[i] = 0
+        residual[i] = xe[i]
+        if z[i] < 0 or z[i] >= n_z or n[i] < 0 or n[i] >= n_n:
+            continue # nuclei outside of the table do not emit
+        cost = 0.0
+        threshold = -np.inf
+        k = n[i]
+        while k >= 0:
+            sn = s1n[z[i], k]
+            if np.isnan(sn):
+                break # unknown separation energy stops the cascade
+            threshold = max(threshold, cost + sn)
+            if not threshold < xe[i]:
+                break
+            nu[i] += 1
+            cost = cost + (sn + ekin)
+            k -= 1
+        residual[i] = xe[i] - cost
+
+
+@_jit
+def _tke(rh, zh, rl, zl, beta, out):
+    for i in range(out.size):
+        initial_distance = (rh[i] + rl[i]) * (1 + 2 * beta[i])
+        out[i] = COULOMB_CST * zh[i] * zl[i] / initial_distance
+
+
+@_jit
+def _sharing(txe, x, xeh, xel):
+    for i in range(txe.size):
+        xel[i] = x[i] * txe[i]
+        xeh[i] = (1 - x[i]) * txe[i]
+
+
+# array interfaces of the kernels
+
+
+def cascade(z, n, xe, s1n, ekin):
+    """
+    Decay cascades of excited nuclei, one nucleus at a time (see ffdd.cascade.decay_many).
+
+    Args:
+        z (int array): Charge numbers of the nuclei.
+        n (int array): Neutron numbers of the nuclei.
+        xe (float array): Excitation energies of the nuclei (MeV).
+        s1n (float array): One-neutron separation energies (Z, N) table (MeV).
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+
+    Returns:
+        nu (int array): Numbers of emitted neutrons.
+        xe (float array): Residual excitation energies (MeV).
+    """
+
+    z = np.ascontiguousarray(z, dtype=np.int64).ravel()
+    n = np.ascontiguousarray(n, dtype=np.int64).ravel()
+    xe = np.ascontiguousarray(xe, dtype=np.float64).ravel()
+    nu = np.empty(xe.size, dtype=np.int64)
+    residual = np.empty(xe.size)
+    _cascade(z, n, xe, np.ascontiguousarray(s1n, dtype=np.float64), float(ekin), nu, residual)
+    return nu, residual
+
+
+def tke(ah, zh, al, zl, beta):
+    """
+    Total kinetic energies of fragmentations (see ffdd.tke.tke).
+
+    Args:
+        ah (int array): Mass numbers of the heavy fragments.
+        zh (int array): Charge numbers of the heavy fragments.
+        al (int array): Mass numbers of the light fragments.
+        zl (int array): Charge numbers of the light fragments.
+        beta (float or float array): Quadrupolar deformation coefficients.
+
+    Returns:
+        tke (float array): Total kinetic energies (MeV), of the broadcast shape.
+    """
+
+    ah, zh, al, zl, beta = np.broadcast_arrays(
+        np.asarray(ah, dtype=np.float64), np.asarray(zh, dtype=np.float64),
+        np.asarray(al, dtype=np.float64), np.asarray(zl, dtype=np.float64),
+        np.asarray(beta, dtype=np.float64),
+    )
+    out = np.empty(ah.shape)
+
+    # nuclear radii with the NumPy power (same rounding as ffdd.tke.nuclear_radius)
+
+    rh = NUCLEAR_RADIUS_R0 * np.power(ah, 1 / 3)
+    rl = NUCLEAR_RADIUS_R0 * np.power(al, 1 / 3)
+    _tke(*(np.ascontiguousarray(v).ravel() for v in (rh, zh, rl, zl, beta)), out.reshape(-1))
+    return out
+
+
+def sharing(txe, x):
+    """
+    Partition of total excitation energies between the fragments
+    (see ffdd.prepared.PreparedFragmentation.excitation_energies).
+
+    Args:
+        txe (float array): Total excitation energies (MeV).
+        x (float array): Light fragment shares of the excitation energy.
+
+    Returns:
+        xeh (float array): Excitation energies of the heavy fragments (MeV).
+        xel (float array): Excitation energies of the light fragments (MeV).
+    """
+
+    txe, x = np.broadcast_arrays(np.asarray(txe, dtype=np.float64), np.asarray(x, dtype=np.float64))
+    xeh, xel = np.empty(txe.shape), np.empty(txe.shape)
+    _sharing(
+        np.ascontiguousarray(txe).ravel(), np.ascontiguousarray(x).ravel(),
+        xeh.reshape(-1), xel.reshape(-1),
+    )
+    return xeh, xel
@@ -3,7 +3,10 @@
 # librairies
 
 import os
-import pandas as pd
+import numpy as np
+from functools import lru_cache
+from ffdd.cache import cached_arrays
+from ffdd.utils import nuclide_table, table_lookup
 
 # parameters
 
@@ -66,22 +69,48 @@ col_names = [
     "atomic_mass_unc",
 ]
 
-# reading and filtering
+# reading and filtering (estimated masses, tagged by #, are ignored)
+
+
+def _read_mass_table(datafile):
+    """ Parser of the AME2020 ASCII file into a dense (Z, N) table of mass excesses (MeV). """
+
+    edges = np.cumsum([0] + col_widths)
+    cols = {name: slice(edges[k], edges[k + 1]) for k, name in enumerate(col_names)}
+
+    z_list, n_list, excess_list = [], [], []
+    with open(datafile) as f:
+        for line in f.readlines()[HEADER:]:
+            try:
+                excess = float(line[cols['mass_excess']])
+                z = int(line[cols['Z']])
+                a = int(line[cols['A']])
+            except ValueError:
+                continue
+            z_list.append(z)
+            n_list.append(a - z)
+            excess_list.append(excess)
+
+    table = nuclide_table(z_list, n_list, np.array(excess_list) * KEV_TO_MEV)
+    return {'mass_excess': table}
+
 
 _datafile = os.path.join(os.path.dirname(__file__), 'data/mass.txt')
-_df = pd.read_fwf(
-    _datafile,
-    skiprows=HEADER,
-    widths=col_widths,
-    names=col_names,
-    usecols=['Z', 'A', 'mass_excess'],
-)
-_df = _df[pd.to_numeric(_df['mass_excess'], errors='coerce').notnull()]
-_df['mass_excess'] = pd.to_numeric(_df['mass_excess'])
 
-# dict
+# dense (Z, N) table of mass excesses (MeV), NaN for missing nuclei, loaded on first use
+
+
+@lru_cache(maxsize=None)
+def load_mass_table():
+    """ Dense (Z, N) table of mass excesses (MeV), NaN for missing nuclei. """
+    return cached_arrays('mass', _datafile, _read_mass_table)['mass_excess']
 
-mass_dict = {(int(row.Z), int(row.A)): row.mass_excess for _, row in _df.iterrows()}
+
+def __getattr__(name):
+    """ Tables loaded on first access (ffdd.mass.mass_excess_table). """
+    if name == 'mass_excess_table':
+        return load_mass_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # nuclear masses function
 
@@ -100,9 +129,33 @@ def nuclear_mass(a, z):
         KeyError: If nucleus was not found in the mass table.
     """
 
-    try:
-        mass_excess = mass_dict[(z, a)] * KEV_TO_MEV
-    except KeyError:
+    n = a - z
+    mass_excess_table = load_mass_table()
+    if 0 <= z < mass_excess_table.shape[0] and 0 <= n < mass_excess_table.shape[1]:
+        mass_excess = mass_excess_table[z, n]
+    else:
+        mass_excess = float('nan')
+    if np.isnan(mass_excess):
         raise KeyError(f'Mass for nucleus (Z={z}, A={a}) not available.')
 
+    return float(mass_excess) + a*U_MEV
+
+
+# vectorized nuclear masses function
+
+
+def nuclear_mass_array(a, z):
+    """ Vectorized reader of tabulated nuclear masses.
+
+    Args:
+        a (int array): Mass numbers.
+        z (int array): Charge numbers.
+
+    Returns:
+        m (float array): Nuclear masses (MeV/c^2), NaN if not available.
+    """
+
+    a, z = np.asarray(a, dtype=int), np.asarray(z, dtype=int)
+    mass_excess = table_lookup(load_mass_table(), z, a - z)
+
     return mass_excess + a*U_MEV
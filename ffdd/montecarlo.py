@@ -0,0 +1,103 @@
+""" Event-by-event Monte Carlo simulation of the neutron emissions in fission """
+
+# librairies
+
+import numpy as np
+from ffdd.yields import read_fission_pairs
+from ffdd.interpolate import interpolate_pairs
+from ffdd.prepared import prepare_fragmentation
+from ffdd.cascade import decay_many
+
+# one record per simulated fission event
+
+EVENT_DTYPE = np.dtype(
+    [
+        ("ah", int), ("zh", int), ("al", int), ("zl", int),
+        ("tke", float), ("xeh", float), ("xel", float),
+        ("nuh", int), ("nul", int),
+    ]
+)
+
+BATCH_SIZE = 10**6
+
+# Monte Carlo sampling of fission events
+
+
+def sample_events(a_target, z_target, n_events, energy = None, ekin = 2.0, beta = 0.2,
+                  model = 'fong', rt = 1, sigma_tke = 8.0, sigma_xe = 0.0,
+                  batch_size = BATCH_SIZE, seed = None):
+    """
+    Monte Carlo simulation of fission events: fragmentations are sampled from the
+    independent yields, the TKE and the excitation energy sharing fluctuate
+    (Gaussian) around the deterministic models, then fragments decay by neutron emissions.
+
+    Args:
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        n_events (int): Number of fission events.
+        energy (float): Incident neutron energy (MeV), the yields are interpolated
+        between the available energies (default: lowest available energy).
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+        beta (float): Average quadrupolar deformation of fragments.
+        model (str): Energy sharing model ('fong' or 'edigy').
+        rt (float): Anisothermal coefficient.
+        sigma_tke (float): Standard deviation of the TKE around the model (MeV).
+        sigma_xe (float): Standard deviation of the light fragment excitation energy
+        around the sharing model, at fixed TXE (MeV).
+        batch_size (int): Number of events per batch.
+        seed (int): Seed of the random generator.
+
+    Yields:
+        events (array): Batch of events of EVENT_DTYPE (fragments, TKE, excitation
+        energies and numbers of emitted neutrons).
+
+    Raises:
+        ValueError: If the model is not 'fong' or 'edigy' (at the first batch).
+    """
+
+    rng = np.random.default_rng(seed)
+
+    # yields interpolated at the incident energy
+
+    if energy is None:
+        energy = read_fission_pairs(a_target, z_target).energies[0]
+    prepared = prepare_fragmentation(a_target, z_target, model)
+    p = interpolate_pairs(a_target, z_target, energy).p[0]
+    listed = np.flatnonzero(p > 0)
+    ah, zh, al, zl = (getattr(prepared, name)[listed] for name in ("ah", "zh", "al", "zl"))
+
+    # deterministic models for all fragmentations (see PreparedFragmentation)
+
+    q = prepared.q0[listed] + energy
+    tke_ff = prepared.tke0[listed] / (1 + 2 * beta)
+    x = pow(rt, 2) * prepared.x[listed]
+
+    # sampling probabilities of fragmentations with available masses
+
+    valid = ~np.isnan(q) & ~np.isnan(x)
+    proba = np.where(valid, p[listed], 0.0)
+    proba = proba / proba.sum()
+
+    # batches of events
+
+    for start in range(0, n_events, batch_size):
+
+        size = min(batch_size, n_events - start)
+        k = rng.choice(proba.size, size=size, p=proba)
+
+        events = np.empty(size, dtype=EVENT_DTYPE)
+        events["ah"], events["zh"], events["al"], events["zl"] = ah[k], zh[k], al[k], zl[k]
+
+        # energy balance and sharing with Gaussian fluctuations
+
+        events["tke"] = tke_ff[k] + sigma_tke * rng.standard_normal(size)
+        txe = q[k] - events["tke"]
+        events["xel"] = x[k] * txe + sigma_xe * rng.standard_normal(size)
+        events["xeh"] = txe - events["xel"]
+
+        # neutron decay cascades of the excited fragments
+
+        events["nuh"], _ = decay_many(ah[k], zh[k], events["xeh"], ekin=ekin)
+        events["nul"], _ = decay_many(al[k], zl[k], events["xel"], ekin=ekin)
+
+        yield events
@@ -0,0 +1,116 @@
+""" Observables of the neutron emissions in fission """
+
+# librairies
+
+import numpy as np
+from dataclasses import dataclass
+
+# result of the decay of all fragmentations at one incident energy
+
+
+@dataclass(frozen=True)
+class NubarResult:
+    """
+    Neutron emissions of all fragmentations of a fission at one incident energy.
+
+    Attributes:
+        energy (float): Incident neutron energy (MeV).
+        ah (int array): Mass numbers of the heavy fragments.
+        zh (int array): Charge numbers of the heavy fragments.
+        al (int array): Mass numbers of the light fragments.
+        zl (int array): Charge numbers of the light fragments.
+        p (float array): Normalized fragmentation probabilities.
+        nuh (int array): Numbers of neutrons emitted by the heavy fragments.
+        nul (int array): Numbers of neutrons emitted by the light fragments.
+    """
+
+    energy: float
+    ah: np.ndarray
+    zh: np.ndarray
+    al: np.ndarray
+    zl: np.ndarray
+    p: np.ndarray
+    nuh: np.ndarray
+    nul: np.ndarray
+
+    @classmethod
+    def from_fragments(cls, energy, ff, nuh, nul, valid):
+        """
+        Result from a table of coupled fragments and their neutron emissions.
+
+        Args:
+            energy (float): Incident neutron energy (MeV).
+            ff (array): Coupled fission fragments (FF_COUPLED_DTYPE).
+            nuh (int array): Numbers of neutrons emitted by the heavy fragments.
+            nul (int array): Numbers of neutrons emitted by the light fragments.
+            valid (bool array): Fragmentations kept in the averages.
+
+        Returns:
+            result (NubarResult): Result restricted to the valid fragmentations.
+        """
+
+        p = ff["p"][valid]
+        return cls(
+            energy,
+            ff["ah"][valid].astype(np.int16),
+            ff["zh"][valid].astype(np.int16),
+            ff["al"][valid].astype(np.int16),
+            ff["zl"][valid].astype(np.int16),
+            p / p.sum(),
+            nuh[valid].astype(np.int16),
+            nul[valid].astype(np.int16),
+        )
+
+    @property
+    def nu(self):
+        """ Total numbers of emitted neutrons of each fragmentation. """
+        return self.nuh + self.nul
+
+    @property
+    def nubar(self):
+        """ Average total number of emitted neutrons. """
+        return float(np.dot(self.p, self.nu))
+
+    @property
+    def nubar_heavy(self):
+        """ Average number of neutrons emitted by the heavy fragment. """
+        return float(np.dot(self.p, self.nuh))
+
+    @property
+    def nubar_light(self):
+        """ Average number of neutrons emitted by the light fragment. """
+        return float(np.dot(self.p, self.nul))
+
+    @property
+    def heavy_light_ratio(self):
+        """
+        Ratio of the neutrons emitted by the heavy and light fragments
+        (inf or NaN without light emission).
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return float(np.float64(self.nubar_heavy) / self.nubar_light)
+
+    @property
+    def p_nu(self):
+        """ Multiplicity distribution P(nu), indexed by the total number of neutrons. """
+        return np.bincount(self.nu, weights=self.p)
+
+    def _nu_vs(self, xh, xl):
+        """ Average number of neutrons per fragment versus a fragment property. """
+        x = np.concatenate([xh, xl])
+        nu = np.concatenate([self.nuh, self.nul])
+        p = np.concatenate([self.p, self.p])
+        values, index = np.unique(x, return_inverse=True)
+        weights = np.bincount(index, weights=p)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return values, np.bincount(index, weights=p * nu) / weights
+
+    @property
+    def nu_a(self):
+        """ Average number of neutrons emitted by a fragment versus its mass: (A, nu(A)). """
+        return self._nu_vs(self.ah, self.al)
+
+    @property
+    def nu_z(self):
+        """ Average number of neutrons emitted by a fragment versus its charge: (Z, nu(Z)). """
+        return self._nu_vs(self.zh, self.zl)
@@ -0,0 +1,237 @@
+""" Process-pool driver of the average neutron emissions for many targets """
+
+# librairies
+
+import os
+import asyncio
+import itertools
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from ffdd.yields import read_fission_pairs
+from ffdd.prepared import prepare_fragmentation
+from ffdd.averages import pair_averages
+
+# one result per (target, incident energy, parameters) work unit
+
+NubarRecord = namedtuple(
+    "NubarRecord", ["a_target", "z_target", "energy", "ekin", "beta", "model", "rt", "nubar"]
+)
+
+# worker functions
+
+
+def _init_worker(targets):
+    """
+    Load the nuclear data of all targets once per worker process.
+
+    Args:
+        targets (list): Target nuclei (A, Z).
+    """
+
+    for a_target, z_target in targets:
+        read_fission_pairs(a_target, z_target)
+
+
+def _run_unit(unit):
+    """
+    Average neutron multiplicity of one work unit.
+
+    Args:
+        unit (tuple): Target (A, Z), index of the incident energy and parameters
+        (ekin, beta, model, rt).
+
+    Returns:
+        record (NubarRecord): Result of the work unit.
+    """
+
+    a_target, z_target, k, (ekin, beta, model, rt) = unit
+    pairs = read_fission_pairs(a_target, z_target)
+    prepared = prepare_fragmentation(a_target, z_target, model)
+    averages = pair_averages(
+        prepared, pairs.energies[k:k + 1], pairs.p[k:k + 1], ekin=ekin, beta=beta, rt=rt,
+    )
+    return NubarRecord(
+        a_target, z_target, float(pairs.energies[k]), ekin, beta, model, rt,
+        float(averages.nubar[0]),
+    )
+
+
+# work units
+
+
+def _as_list(value):
+    """ Parameter value(s) as a list. """
+
+    if isinstance(value, str) or np.ndim(value) == 0:
+        return [value]
+    return list(value)
+
+
+def iter_work_units(targets, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1):
+    """
+    Work units (target, incident energy, parameters) of a scan, generated lazily in a
+    deterministic order: targets, then parameters (product of ekin, beta, model and rt),
+    then energies.
+
+    Args:
+        targets (list): Target nuclei (A, Z).
+        ekin (float or float list): Average kinetic energies of emitted neutrons (MeV).
+        beta (float or float list): Average quadrupolar deformations of fragments.
+        model (str or str list): Energy sharing models ('fong' or 'edigy').
+        rt (float or float list): Anisothermal coefficients.
+
+    Yields:
+        unit (tuple): Work unit (A, Z, energy index, (ekin, beta, model, rt)).
+    """
+
+    params = list(itertools.product(_as_list(ekin), _as_list(beta), _as_list(model), _as_list(rt)))
+
+    for a_target, z_target in targets:
+        energies = read_fission_pairs(a_target, z_target).energies
+        for p in params:
+            for k in range(len(energies)):
+                yield (a_target, z_target, k, p)
+
+
+def work_units(targets, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1):
+    """
+    Work units (target, incident energy, parameters) of a scan, in the order of iter_work_units.
+
+    Args:
+        targets (list): Target nuclei (A, Z).
+        ekin (float or float list): Average kinetic energies of emitted neutrons (MeV).
+        beta (float or float list): Average quadrupolar deformations of fragments.
+        model (str or str list): Energy sharing models ('fong' or 'edigy').
+        rt (float or float list): Anisothermal coefficients.
+
+    Returns:
+        units (list): Work units (A, Z, energy index, (ekin, beta, model, rt)).
+    """
+
+    return list(iter_work_units(targets, ekin=ekin, beta=beta, model=model, rt=rt))
+
+
+# average neutron emissions for many targets
+
+
+def nubar_many(targets, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1, workers = None):
+    """
+    Average neutron multiplicity in fission for many targets, incident
+    energies and parameters, spread over a pool of worker processes.
+
+    Args:
+        targets (list): Target nuclei (A, Z).
+        ekin (float or float list): Average kinetic energies of emitted neutrons (MeV).
+        beta (float or float list): Average quadrupolar deformations of fragments.
+        model (str or str list): Energy sharing models ('fong' or 'edigy').
+        rt (float or float list): Anisothermal coefficients.
+        workers (int): Number of worker processes (default: number of CPUs, 1: no pool).
+
+    Returns:
+        records (list): NubarRecord of each work unit, in the order of work_units.
+    """
+
+    targets = [(int(a), int(z)) for a, z in targets]
+    units = work_units(targets, ekin=ekin, beta=beta, model=model, rt=rt)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(units)))
+
+    if workers == 1:
+        return [_run_unit(unit) for unit in units]
+
+    chunksize = max(1, len(units) // (4 * workers))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(targets,)
+    ) as executor:
+        return list(executor.map(_run_unit, units, chunksize=chunksize))
+
+
+# streaming of the average neutron emissions
+
+
+def iter_nubar(targets, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1, workers = None):
+    """
+    Average neutron multiplicity in fission for many targets, incident energies and
+    parameters, yielded one work unit at a time as soon as it is computed. Work units
+    are generated lazily and at most two per worker are in flight (constant memory).
+
+    Args:
+        targets (list): Target nuclei (A, Z).
+        ekin (float or float list): Average kinetic energies of emitted neutrons (MeV).
+        beta (float or float list): Average quadrupolar deformations of fragments.
+        model (str or str list): Energy sharing models ('fong' or 'edigy').
+        rt (float or float list): Anisothermal coefficients.
+        workers (int): Number of worker processes (default: number of CPUs, in the order
+        of completion; 1: no pool, in the order of work_units).
+
+    Yields:
+        record (NubarRecord): Result of a work unit.
+    """
+
+    targets = [(int(a), int(z)) for a, z in targets]
+    units = iter_work_units(targets, ekin=ekin, beta=beta, model=model, rt=rt)
+    workers = workers or os.cpu_count() or 1
+
+    # no more workers than work units (only the first ones are generated to count them)
+
+    head = list(itertools.islice(units, workers))
+    workers = max(1, min(workers, len(head)))
+    units = itertools.chain(head, units)
+
+    if workers == 1:
+        for unit in units:
+            yield _run_unit(unit)
+        return
+
+    # bounded window of work units submitted to the pool
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(targets,)
+    ) as executor:
+        pending = set()
+        try:
+            for unit in itertools.chain(units, [None]):
+                if unit is not None:
+                    pending.add(executor.submit(_run_unit, unit))
+                while pending and (unit is None or len(pending) >= 2 * workers):
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def aiter_nubar(targets, ekin = 2.0, beta = 0.2, model = 'fong', rt = 1, workers = None):
+    """
+    Asynchronous version of iter_nubar: each result is awaited in a worker thread,
+    so that the event loop (e.g. a live dashboard) keeps running during the scan.
+    The stream is closed in the same thread, after a result still being computed.
+
+    Args:
+        targets (list): Target nuclei (A, Z).
+        ekin (float or float list): Average kinetic energies of emitted neutrons (MeV).
+        beta (float or float list): Average quadrupolar deformations of fragments.
+        model (str or str list): Energy sharing models ('fong' or 'edigy').
+        rt (float or float list): Anisothermal coefficients.
+        workers (int): Number of worker processes (see iter_nubar).
+
+    Yields:
+        record (NubarRecord): Result of a work unit.
+    """
+
+    records = iter_nubar(targets, ekin=ekin, beta=beta, model=model, rt=rt, workers=workers)
+    done = object()
+    loop = asyncio.get_running_loop()
+
+    # a single thread runs the stream: close waits for a running next (e.g. on cancellation)
+
+    with ThreadPoolExecutor(max_workers=1) as thread:
+        try:
+            while True:
+                record = await loop.run_in_executor(thread, next, records, done)
+                if record is done:
+                    break
+                yield record
+        finally:
+            await asyncio.shield(loop.run_in_executor(thread, records.close))
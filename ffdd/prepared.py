@@ -0,0 +1,172 @@
+""" Energy-independent precomputation of the fragmentations of a target """
+
+# librairies
+
+import numpy as np
+from dataclasses import dataclass
+from ffdd.yields import read_fission_pairs, _cached
+from ffdd.tke import tke
+from ffdd.energy import q_value_array, sharing_factor, check_sharing_model
+from ffdd.cascade import decay_many
+from ffdd.instrument import stage
+from ffdd import kernels
+
+# fragmentations with their energy-independent terms
+
+
+@dataclass(frozen=True)
+class PreparedFragmentation:
+    """
+    Fragmentations of a target with the terms that do not depend on the incident
+    energy: the Q-value shifts linearly with the energy, the TKE scales as
+    1 / (1 + 2 beta) and the sharing factor only depends on the fragments.
+
+    Attributes:
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        model (str): Energy sharing model ('fong' or 'edigy').
+        ah (int array): Mass numbers of the heavy fragments.
+        zh (int array): Charge numbers of the heavy fragments.
+        al (int array): Mass numbers of the light fragments.
+        zl (int array): Charge numbers of the light fragments.
+        q0 (float array): Q-values at zero incident energy (MeV), NaN if a mass is missing.
+        tke0 (float array): TKE of spherical fragments, beta = 0 (MeV).
+        x (float array): Light fragment share of the excitation energy at rt = 1,
+        NaN if not available.
+    """
+
+    a_target: int
+    z_target: int
+    model: str
+    ah: np.ndarray
+    zh: np.ndarray
+    al: np.ndarray
+    zl: np.ndarray
+    q0: np.ndarray
+    tke0: np.ndarray
+    x: np.ndarray
+
+    @classmethod
+    def from_fragments(cls, a_target, z_target, ah, zh, al, zl, model = 'fong'):
+        """
+        Precomputation of the energy-independent terms of fragmentations.
+
+        Args:
+            a_target (int): Mass number of the target fissile nucleus.
+            z_target (int): Charge number of the target fissile nucleus.
+            ah (int array): Mass numbers of the heavy fragments.
+            zh (int array): Charge numbers of the heavy fragments.
+            al (int array): Mass numbers of the light fragments.
+            zl (int array): Charge numbers of the light fragments.
+            model (str): Energy sharing model ('fong' or 'edigy').
+
+        Returns:
+            prepared (PreparedFragmentation): Read-only prepared fragmentations.
+
+        Raises:
+            ValueError: If the model is not 'fong' or 'edigy'.
+        """
+
+        ah, zh = np.array(ah, dtype=int), np.array(zh, dtype=int)
+        al, zl = np.array(al, dtype=int), np.array(zl, dtype=int)
+
+        with stage("q_value"):
+            q0 = q_value_array(a_target, z_target, ah, zh, al, zl, 0.0)
+        with stage("tke"):
+            tke0 = tke(ah, zh, al, zl, 0.0)
+        with stage("sharing"):
+            x = np.asarray(sharing_factor(ah, zh, al, zl, model), dtype=float)
+
+        prepared = cls(a_target, z_target, model, ah, zh, al, zl, q0, tke0, x)
+        for name in ("ah", "zh", "al", "zl", "q0", "tke0", "x"):
+            getattr(prepared, name).flags.writeable = False
+        return prepared
+
+    @property
+    def valid(self):
+        """ Fragmentations with all the required masses and level densities available. """
+        return ~np.isnan(self.q0) & ~np.isnan(self.x)
+
+    def txe(self, energy, beta = 0.2):
+        """
+        Total excitation energies of the fragmentations (MeV).
+
+        Args:
+            energy (float or array): Incident neutron energy (MeV), broadcast against the
+            fragmentations.
+            beta (float or array): Average quadrupolar deformation of fragments.
+        """
+        return self.q0 + energy - self.tke0 / (1 + 2 * np.asarray(beta))
+
+    def excitation_energies(self, energy, beta = 0.2, rt = 1):
+        """
+        Excitation energies of the heavy and light fragments (MeV).
+
+        Args:
+            energy (float or array): Incident neutron energy (MeV), broadcast against the
+            fragmentations.
+            beta (float or array): Average quadrupolar deformation of fragments.
+            rt (float or array): Anisothermal coefficient.
+
+        Returns:
+            xeh (float array): Excitation energies of the heavy fragments (MeV).
+            xel (float array): Excitation energies of the light fragments (MeV).
+        """
+        txe = self.txe(energy, beta)
+        x = pow(np.asarray(rt), 2) * self.x
+        if kernels.ENABLED:
+            return kernels.sharing(txe, x)
+        return (1 - x) * txe, x * txe
+
+    def multiplicities(self, energy, ekin = 2.0, beta = 0.2, rt = 1):
+        """
+        Neutron emissions of the fragmentations: a vector add plus the decay cascades.
+
+        Args:
+            energy (float or array): Incident neutron energy (MeV), broadcast against the
+            fragmentations.
+            ekin (float): Average kinetic energy of emitted neutrons (MeV).
+            beta (float or array): Average quadrupolar deformation of fragments.
+            rt (float or array): Anisothermal coefficient.
+
+        Returns:
+            nuh (int array): Number of neutrons emitted by the heavy fragments.
+            nul (int array): Number of neutrons emitted by the light fragments.
+            valid (bool array): Fragmentations with all the required masses available.
+        """
+        xeh, xel = self.excitation_energies(energy, beta, rt)
+        with stage("cascade"):
+            nuh, _ = decay_many(self.ah, self.zh, xeh, ekin=ekin)
+            nul, _ = decay_many(self.al, self.zl, xel, ekin=ekin)
+        return nuh, nul, ~np.isnan(xeh)
+
+
+# prepared fragmentations of the pairs of an evaluation
+
+
+def prepare_fragmentation(a_target, z_target, model = 'fong'):
+    """
+    Prepared fragmentations of a target, on the pairs of all its incident
+    energies (see read_fission_pairs), cached with the evaluation.
+
+    Args:
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        model (str): Energy sharing model ('fong' or 'edigy').
+
+    Returns:
+        prepared (PreparedFragmentation): Prepared fragmentations of the target.
+
+    Raises:
+        ValueError: If the model is not 'fong' or 'edigy'.
+    """
+
+    check_sharing_model(model)
+
+    def build(filepath):
+        pairs = read_fission_pairs(a_target, z_target)
+        return PreparedFragmentation.from_fragments(
+            a_target, z_target, pairs.ah, pairs.zh, pairs.al, pairs.zl, model=model
+        )
+
+    return _cached(f"prepared-{model}", a_target, z_target, build)
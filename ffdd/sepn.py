@@ -3,15 +3,38 @@
 # librairies
 
 import os
-import pandas as pd
+import numpy as np
+from functools import lru_cache
+from ffdd.cache import cached_arrays
+from ffdd.utils import nuclide_table, table_lookup
 
 # neutron separation file
 
+
+def _read_sepn_table(datafile):
+    """Parser of the LANL file into a dense (Z, N) table of S1n (MeV)."""
+    z, n, s1n = np.loadtxt(datafile, usecols=(0, 1, 2), unpack=True)
+    known = s1n > -2000.0  # filter unknown values (tagged by -2000.)
+    return {'s1n': nuclide_table(z[known], n[known], s1n[known])}
+
+
 _datafile = os.path.join(os.path.dirname(__file__), 'data/sepn.dat')
-_df = pd.read_csv(_datafile,  sep=r'\s+', names=['Z', 'N', 'S1n', 'S2n'])
-_df.set_index(['Z', 'N'], inplace=True)
-_df = _df[_df['S1n'] > -2000.0]  # filter unknown values (tagged by -2000.)
-_s1n_dict = {(Z, N): S1n for (Z, N), S1n in _df['S1n'].items()}
+
+# dense (Z, N) table of single neutron separation energies (MeV), NaN for missing nuclei,
+# loaded on first use
+
+
+@lru_cache(maxsize=None)
+def load_s1n_table():
+    """Dense (Z, N) table of single neutron separation energies (MeV), NaN for missing nuclei."""
+    return cached_arrays('sepn', _datafile, _read_sepn_table)['s1n']
+
+
+def __getattr__(name):
+    """Tables loaded on first access (ffdd.sepn.s1n_table)."""
+    if name == 's1n_table':
+        return load_s1n_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # single neutron separation energy function
 
@@ -26,5 +49,26 @@ def sepn(a, z):
         sn (float): Single neutron separation energy (MeV).
     """
     n = a - z
-    sn = _s1n_dict.get((z, n), float("nan"))
+    s1n_table = load_s1n_table()
+    if 0 <= z < s1n_table.shape[0] and 0 <= n < s1n_table.shape[1]:
+        sn = float(s1n_table[z, n])
+    else:
+        sn = float("nan")
+    return sn
+
+
+# vectorized single neutron separation energy function
+
+def sepn_array(a, z):
+    """Vectorized single neutron separation energy.
+
+    Args:
+        a (int array): Mass numbers.
+        z (int array): Charge numbers.
+
+    Returns:
+        sn (float array): Single neutron separation energies (MeV), NaN if not available.
+    """
+    a, z = np.asarray(a, dtype=int), np.asarray(z, dtype=int)
+    sn = table_lookup(load_s1n_table(), z, a - z)
     return sn
@@ -0,0 +1,88 @@
+""" Multi-parameter sweeps of the average neutron emissions in fission """
+
+# librairies
+
+import numpy as np
+from collections import namedtuple
+from ffdd.yields import read_fission_pairs
+from ffdd.energy import check_sharing_model
+from ffdd.prepared import prepare_fragmentation
+from ffdd.cascade import CHUNK_SIZE
+
+# labelled N-dimensional result
+
+NUBAR_GRID_DIMS = ("energy", "beta", "ekin", "rt", "model")
+
+NubarGrid = namedtuple("NubarGrid", ["dims", "coords", "values"])
+
+# average neutron emissions over a grid of parameters
+
+
+def nubar_grid(a_target, z_target, beta = (0.2,), ekin = (2.0,), rt = (1,), model = ('fong',)):
+    """
+    Average neutron multiplicity in fission over a grid of model parameters.
+
+    Args:
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        beta (float list): Average quadrupolar deformations of fragments.
+        ekin (float list): Average kinetic energies of emitted neutrons (MeV).
+        rt (float list): Anisothermal coefficients.
+        model (str list): Energy sharing models ('fong' and/or 'edigy').
+
+    Returns:
+        grid (NubarGrid): Labelled result with
+              dims (tuple): Names of the dimensions ('energy', 'beta', 'ekin', 'rt', 'model'),
+              coords (dict): Coordinates of each dimension (energies in MeV),
+              values (float array): Average total number of emitted neutrons,
+              of shape (energies, beta, ekin, rt, model).
+    """
+
+    beta = np.atleast_1d(np.asarray(beta, dtype=float))
+    ekin = np.atleast_1d(np.asarray(ekin, dtype=float))
+    rt = np.atleast_1d(np.asarray(rt, dtype=float))
+    model = [model] if isinstance(model, str) else list(model)
+
+    for name in model:
+        check_sharing_model(name)
+
+    pairs = read_fission_pairs(a_target, z_target)
+    energies = pairs.energies
+    values = np.empty((len(energies), beta.size, ekin.size, rt.size, len(model)))
+
+    # energy-independent terms prepared once per model, broadcast over
+    # (energies, beta, rt, pairs) by chunks of energies
+
+    rows = max(1, CHUNK_SIZE // max(1, beta.size * rt.size * pairs.ah.size))
+
+    for m, name in enumerate(model):
+
+        prepared = prepare_fragmentation(a_target, z_target, name)
+        weights = np.where(prepared.valid, pairs.p, 0.0)
+        norm = weights.sum(axis=1)
+
+        for j, e_n in enumerate(ekin):
+            for start in range(0, energies.size, rows):
+
+                # neutron decay cascades of the excited fragments
+
+                k = slice(start, start + rows)
+                nuh, nul, _ = prepared.multiplicities(
+                    energies[k, None, None, None], ekin=e_n,
+                    beta=beta[:, None, None], rt=rt[:, None],
+                )
+
+                # average decay of fission over all fragmentations with available masses
+
+                nu = np.einsum("ep,ebrp->ebr", weights[k], nuh + nul)
+                values[k, :, j, :, m] = nu / norm[k, None, None]
+
+    coords = {
+        "energy": np.array(energies),
+        "beta": beta,
+        "ekin": ekin,
+        "rt": rt,
+        "model": np.array(model),
+    }
+
+    return NubarGrid(NUBAR_GRID_DIMS, coords, values)
@@ -1,6 +1,8 @@
 """ Total Kinetic Energy (TKE) simulation for fission fragments """
 
+import numpy as np
 from ffdd.utils import COULOMB_CST, NUCLEAR_RADIUS_R0
+from ffdd import kernels
 
 # nuclear radius function
 
@@ -38,6 +40,11 @@ def tke(ah, zh, al, zl, beta = 0.2):
         tke (float): Total kinetic energy (MeV).
     """
 
+    # compiled kernel for arrays of fragmentations (Numba installed)
+
+    if kernels.ENABLED and isinstance(ah, np.ndarray):
+        return kernels.tke(ah, zh, al, zl, beta)
+
     # nuclear radii (fm)
 
     rh = nuclear_radius(ah)
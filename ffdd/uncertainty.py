@@ -0,0 +1,124 @@
+""" Propagation of the fission yields uncertainties to the neutron multiplicity """
+
+# librairies
+
+import numpy as np
+from collections import namedtuple
+from ffdd.yields import load_fission_yields, load_fission_yields_uncertainties, complementary_pairs
+from ffdd.prepared import prepare_fragmentation
+
+# replicas of yields drawn at once (memory of a batch: REPLICA_BATCH x fragments)
+
+REPLICA_BATCH = 256
+
+# average multiplicity and its uncertainty for each incident energy
+
+NubarUncertainty = namedtuple(
+    "NubarUncertainty", ["energies", "nominal", "mean", "std", "quantiles", "samples"]
+)
+
+# fragment weights of the average multiplicity
+
+
+def fragment_weights(light, heavy, nu, valid, n_fragments):
+    """
+    Linear map from the yields of the fragments to the average multiplicity: with
+    pair probabilities p = (y[light] + y[heavy]) / 2, nubar = (y @ c) / (y @ d).
+
+    Args:
+        light (int array): Index of the light fragment of each pair, -1 if not listed.
+        heavy (int array): Index of the heavy fragment of each pair, -1 if not listed.
+        nu (int array): Number of emitted neutrons of each pair.
+        valid (bool array): Pairs with all the required masses available.
+        n_fragments (int): Number of fragments.
+
+    Returns:
+        c (float array): Weight of each fragment in the numerator (emitted neutrons).
+        d (float array): Weight of each fragment in the denominator (normalisation).
+    """
+
+    c = np.zeros(n_fragments)
+    d = np.zeros(n_fragments)
+    for index in (light, heavy):
+        listed = valid & (index >= 0)
+        c += 0.5 * np.bincount(index[listed], weights=nu[listed], minlength=n_fragments)
+        d += 0.5 * np.bincount(index[listed], minlength=n_fragments)
+
+    return c, d
+
+
+# uncertainty of the average neutron emissions in fission
+
+
+def nubar_uncertainty(a_target, z_target, n_samples = 1000, quantiles = (0.05, 0.5, 0.95),
+                      ekin = 2.0, beta = 0.2, model = 'fong', rt = 1,
+                      batch_size = REPLICA_BATCH, seed = None):
+    """
+    Uncertainty of the average neutron multiplicity due to the uncertainties of the
+    independent yields: replicas of the yields are drawn from uncorrelated Gaussian
+    distributions (negative yields set to zero), and the average multiplicity of all
+    the replicas is computed at once as matrix-vector products.
+
+    Args:
+        a_target (int): Mass number of the target fissile nucleus.
+        z_target (int): Charge number of the target fissile nucleus.
+        n_samples (int): Number of replicas of the yields.
+        quantiles (float tuple): Quantiles of the average multiplicity to compute.
+        ekin (float): Average kinetic energy of emitted neutrons (MeV).
+        beta (float): Average quadrupolar deformation of fragments.
+        model (str): Energy sharing model ('fong' or 'edigy').
+        rt (float): Anisothermal coefficient.
+        batch_size (int): Number of replicas drawn at once.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        result (NubarUncertainty): With, for each incident energy,
+              energies (float array): Incident energies (MeV),
+              nominal (float array): Average multiplicity of the nominal yields,
+              mean (float array): Mean of the average multiplicity over the replicas,
+              std (float array): Standard deviation over the replicas,
+              quantiles (float array): Quantiles over the replicas (quantiles x energies),
+              samples (float array): Average multiplicity of each replica (replicas x energies).
+    """
+
+    rng = np.random.default_rng(seed)
+
+    # yields, uncertainties and fragmentations of all incident energies
+
+    energies, a_ff, z_ff, yields = load_fission_yields(a_target, z_target)
+    unc = load_fission_yields_uncertainties(a_target, z_target)
+    light, heavy, *_ = complementary_pairs(a_target, z_target, a_ff, z_ff)
+
+    # neutron emissions of all fragmentations at all energies, independent of the yields
+
+    prepared = prepare_fragmentation(a_target, z_target, model)
+    nuh, nul, valid = prepared.multiplicities(energies[:, None], ekin=ekin, beta=beta, rt=rt)
+
+    nominal = np.empty(energies.size)
+    samples = np.empty((n_samples, energies.size))
+
+    for i in range(energies.size):
+        c, d = fragment_weights(light, heavy, nuh[i] + nul[i], valid[i], a_ff.size)
+
+        # fragments not listed at this energy have a zero yield
+
+        listed = ~np.isnan(yields[i])
+        y = np.where(listed, yields[i], 0.0)
+        sigma = np.where(listed, unc[i], 0.0)
+        nominal[i] = (y @ c) / (y @ d)
+
+        # batches of replicas (replicas x fragments)
+
+        for start in range(0, n_samples, batch_size):
+            k = min(batch_size, n_samples - start)
+            replicas = np.maximum(y + sigma * rng.standard_normal((k, y.size)), 0.0)
+            samples[start:start + k, i] = (replicas @ c) / (replicas @ d)
+
+    return NubarUncertainty(
+        energies,
+        nominal,
+        samples.mean(axis=0),
+        samples.std(axis=0, ddof=1),
+        np.quantile(samples, quantiles, axis=0),
+        samples,
+    )
@@ -1,11 +1,53 @@
 """ Utils """
 
+import numpy as np
+
 # physics constants
 
 NUCLEAR_RADIUS_R0 = 1.2 # fm
 COULOMB_CST = 1.44 # MeV.fm 
 NEUTRON_MASS = 939.56542194 # MeV
 
+# dense (Z, N) nuclide tables
+
+def nuclide_table(z, n, values):
+    """
+    Dense table of a nuclide property indexed by charge and neutron numbers.
+
+    Args:
+        z (int array): Charge numbers of the tabulated nuclei.
+        n (int array): Neutron numbers of the tabulated nuclei.
+        values (float array): Property of the tabulated nuclei.
+
+    Returns:
+        table (float array): 2D array of shape (Zmax+1, Nmax+1), NaN for missing nuclei.
+    """
+
+    z, n = np.asarray(z, dtype=int), np.asarray(n, dtype=int)
+    table = np.full((z.max() + 1, n.max() + 1), np.nan)
+    table[z, n] = values
+    return table
+
+
+def table_lookup(table, z, n):
+    """
+    Vectorized lookup in a dense (Z, N) nuclide table.
+
+    Args:
+        table (float array): 2D array indexed by (Z, N).
+        z (int array): Charge numbers.
+        n (int array): Neutron numbers.
+
+    Returns:
+        values (float array): Tabulated values, NaN outside of the table.
+    """
+
+    z, n = np.broadcast_arrays(np.asarray(z, dtype=int), np.asarray(n, dtype=int))
+    inside = (z >= 0) & (z < table.shape[0]) & (n >= 0) & (n < table.shape[1])
+    values = np.full(z.shape, np.nan)
+    values[inside] = table[z[inside], n[inside]]
+    return values
+
 # available fissile target in FFDD
 
 fiss_z_to_name = {
@@ -4,32 +4,54 @@
 
 import os
 import re
-import openmc
+import glob
+import threading
 import numpy as np
-from collections import defaultdict
+from collections import OrderedDict, namedtuple
+from ffdd.cache import cached_arrays
+from ffdd.endf import read_nfy_records
+from ffdd.instrument import stage
 from ffdd.utils import fiss_z_to_name, periodic_table
 
-# OpenMC warning for missing uncertainties
+# yields of one incident energy: fragments (A, Z) with isomers merged
 
-import warnings
-warnings.filterwarnings("ignore", "Using UFloat objects with std_dev==0")
+NFY_DTYPE = np.dtype([("a", int), ("z", int), ("yield", float)])
 
-# reader of fission yields (via openmc)
+# coupled fragmentations of one incident energy
 
+FF_COUPLED_DTYPE = np.dtype(
+    [("ah", int), ("zh", int), ("al", int), ("zl", int), ("p", float)]
+)
 
-def read_fission_yields(a, z):
+# format version of the compact yield store (part of the name of its binary cache)
+
+YIELDS_STORE_VERSION = 2
+
+# in-process LRU cache of evaluations, coupled fragmentations and pair yields
+
+YIELDS_CACHE_SIZE = 64
+
+FissionPairs = namedtuple("FissionPairs", ["energies", "ah", "zh", "al", "zl", "p"])
+
+YieldsCacheInfo = namedtuple("YieldsCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0, "maxsize": YIELDS_CACHE_SIZE}
+
+# path of the evaluation of a target nucleus
+
+
+def _yields_file(a, z):
     """
-    Reader of indepentend neutron-induced fission yield
-    from nuclear data librairy ENDF/BVIII.0 for all available
-    incident energies.
+    Path of the ENDF/BVIII.0 fission yields evaluation of a target nucleus.
 
     Args:
         a (int): Mass number of the target nucleus.
         z (int): Charge number of the target nucleus.
 
     Returns:
-        energy_list (list): Incident energies (MeV).
-        nfy_list (dict): Independent yields with (string format)
+        filepath (str): Path of the ENDF file.
     """
 
     if z in fiss_z_to_name:
@@ -44,12 +66,281 @@ def read_fission_yields(a, z):
             f"ERROR: Target nucleus (A={a},Z={z}) unavailable in NFY data."
         )
 
-    nfy_eval = openmc.data.FissionProductYields(filepath)
-    energy_list = nfy_eval.energies
-    nfy_list = nfy_eval.independent
-    energy_list = [e*1e-6 for e in energy_list] # eV to MeV
+    return filepath
+
+
+# converter of an ENDF evaluation into a compact yield store
+
+
+def _convert_evaluation(filepath):
+    """
+    Conversion of an ENDF/BVIII.0 fission yields evaluation into arrays.
+
+    Args:
+        filepath (str): Path of the ENDF file.
+
+    Returns:
+        store (dict): Arrays of the evaluation with
+              energies (float array): Incident energies (MeV),
+              a (int array): Mass numbers of the fragments,
+              z (int array): Charge numbers of the fragments,
+              yields (float array): Independent yields (energies x fragments),
+              isomers merged, NaN for fragments not listed at an energy,
+              unc (float array): Standard deviations of the yields (energies x fragments),
+              isomers merged in quadrature, NaN for fragments not listed at an energy.
+    """
+
+    records = read_nfy_records(filepath)
+    energies, energy_index = np.unique(records["energy"], return_inverse=True)
+    z_ff, a_ff = np.divmod(records["za"], 1000)
+
+    # union of the fragments listed at all incident energies, sorted by A and Z
+
+    nuclides, nuclide_index = np.unique(a_ff * 1000 + z_ff, return_inverse=True)
+
+    # merging isomeric (metastables) states
+
+    yields = np.zeros((energies.size, nuclides.size))
+    variances = np.zeros((energies.size, nuclides.size))
+    listed = np.zeros((energies.size, nuclides.size), dtype=bool)
+    np.add.at(yields, (energy_index, nuclide_index), records["yield"])
+    np.add.at(variances, (energy_index, nuclide_index), records["unc"]**2)
+    listed[energy_index, nuclide_index] = True
+    yields[~listed] = np.nan
+    unc = np.sqrt(variances)
+    unc[~listed] = np.nan
+
+    return {
+        "energies": energies*1e-6, # eV to MeV
+        "a": nuclides // 1000,
+        "z": nuclides % 1000,
+        "yields": yields,
+        "unc": unc,
+    }
+
+
+def _load_evaluation(filepath):
+    """ Compact yield store of an ENDF file, converted on first use. """
+
+    name = f"yields-v{YIELDS_STORE_VERSION}-" + os.path.splitext(os.path.basename(filepath))[0]
+    return cached_arrays(name, filepath, _convert_evaluation)
+
+
+# loader of the compact yield store
+
+
+def load_fission_yields(a, z):
+    """
+    Loader of the compact store of independent neutron-induced fission
+    yields of a target nucleus (converted from ENDF/BVIII.0 on first use).
+
+    Args:
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+
+    Returns:
+        energies (float array): Incident energies (MeV).
+        a_ff (int array): Mass numbers of the fragments.
+        z_ff (int array): Charge numbers of the fragments.
+        yields (float array): Independent yields (energies x fragments), isomers merged,
+        NaN for fragments not listed at an energy.
+    """
+
+    store = _load_evaluation(_yields_file(a, z))
+    return store["energies"], store["a"], store["z"], store["yields"]
+
+
+def load_fission_yields_uncertainties(a, z):
+    """
+    Standard deviations of the independent neutron-induced fission yields
+    of a target nucleus, on the fragments of load_fission_yields.
+
+    Args:
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+
+    Returns:
+        unc (float array): Standard deviations of the yields (energies x fragments),
+        isomers merged in quadrature, NaN for fragments not listed at an energy.
+    """
+
+    return _load_evaluation(_yields_file(a, z))["unc"]
+
+
+# converter of the whole library into compact yield stores
+
+
+def convert_fission_yields():
+    """
+    Conversion of all the ENDF/BVIII.0 evaluations of FFDD into compact
+    yield stores (avoids the ENDF parsing at the first use of each target).
+
+    Returns:
+        files (list): Converted ENDF files.
+    """
+
+    yields_dir = os.path.join(os.path.dirname(__file__), "data/yields")
+    files = sorted(glob.glob(os.path.join(yields_dir, "*.endf")))
+    for filepath in files:
+        _load_evaluation(filepath)
+
+    return files
+
+
+# LRU cache functions
+
+
+def _cached(kind, a, z, build):
+    """
+    Entry of the LRU cache, keyed on the target nucleus and the identity
+    (path, modification time and size) of its ENDF file.
+
+    Args:
+        kind (str): Kind of cached data.
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+        build (callable): Builder of the data from the ENDF file path.
+
+    Returns:
+        value: Cached data.
+    """
+
+    filepath = _yields_file(a, z)
+    stat = os.stat(filepath)
+    key = (kind, a, z, filepath, stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        if key in _cache:
+            _cache_stats["hits"] += 1
+            _cache.move_to_end(key)
+            return _cache[key]
+        _cache_stats["misses"] += 1
+
+    value = build(filepath)
+
+    with _cache_lock:
+        if _cache_stats["maxsize"] is None or _cache_stats["maxsize"] > 0:
+            _cache[key] = value
+            _cache.move_to_end(key)
+        while _cache_stats["maxsize"] is not None and len(_cache) > _cache_stats["maxsize"]:
+            _cache.popitem(last=False)
+
+    return value
+
+
+def yields_cache_info():
+    """
+    Statistics of the LRU cache of evaluations and coupled fragmentations.
+
+    Returns:
+        info (YieldsCacheInfo): Hits, misses, maximum size and current size of the cache.
+    """
+
+    with _cache_lock:
+        return YieldsCacheInfo(
+            _cache_stats["hits"], _cache_stats["misses"], _cache_stats["maxsize"], len(_cache)
+        )
+
+
+def yields_cache_clear():
+    """
+    Clear the LRU cache of evaluations and coupled fragmentations, and its statistics.
+    """
+
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats["hits"] = _cache_stats["misses"] = 0
+
+
+def set_yields_cache_size(maxsize=YIELDS_CACHE_SIZE):
+    """
+    Set the maximum number of entries of the LRU cache (least recently used are evicted).
 
-    return energy_list, nfy_list
+    Args:
+        maxsize (int): Maximum number of entries (0 disables the cache, None for no limit).
+    """
+
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f"ERROR: Cache size must be positive or None (got {maxsize}).")
+
+    with _cache_lock:
+        _cache_stats["maxsize"] = maxsize
+        while maxsize is not None and len(_cache) > maxsize:
+            _cache.popitem(last=False)
+
+
+# reader of fission yields
+
+
+def _read_evaluation(filepath):
+    """ Read-only yields of each incident energy of an ENDF file. """
+
+    with stage("read"):
+        store = _load_evaluation(filepath)
+    energies, a_ff, z_ff, yields = store["energies"], store["a"], store["z"], store["yields"]
+    nfy_list = []
+
+    for row in yields:
+        listed = ~np.isnan(row)
+        nfy = np.empty(np.count_nonzero(listed), dtype=NFY_DTYPE)
+        nfy["a"], nfy["z"], nfy["yield"] = a_ff[listed], z_ff[listed], row[listed]
+        nfy.flags.writeable = False
+        nfy_list.append(nfy)
+
+    return energies.tolist(), nfy_list
+
+
+def read_fission_yields(a, z):
+    """
+    Reader of indepentend neutron-induced fission yield
+    from nuclear data librairy ENDF/BVIII.0 for all available
+    incident energies (cached, see yields_cache_info).
+
+    Args:
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+
+    Returns:
+        energy_list (list): Incident energies (MeV).
+        nfy_list (list): Independent yields for each energy, as read-only arrays of NFY_DTYPE
+        (fragments A, Z and yield, isomers merged, sorted by A and Z).
+    """
+
+    energy_list, nfy_list = _cached("yields", a, z, _read_evaluation)
+
+    return list(energy_list), list(nfy_list)
+
+
+# interned nuclide names: name -> (A, Z, isomeric state)
+
+_NUCLIDE_NAME = re.compile(r"([A-Za-z]+)(\d+)(?:_m(\d+))?")
+_nuclides = {}
+
+
+def nuclide_from_name(name):
+    """
+    Mass number, charge number and isomeric state of a nuclide name (e.g. 'Ag110_m1'),
+    parsed once per name and interned for all evaluations and energies.
+
+    Args:
+        name (str): Nuclide name.
+
+    Returns:
+        nuclide (tuple): (A, Z, isomeric state), None if the name is not a nuclide.
+    """
+
+    try:
+        return _nuclides[name]
+    except KeyError:
+        pass
+
+    match = _NUCLIDE_NAME.match(name)
+    nuclide = None
+    if match and match.group(1) in periodic_table:
+        element, a, isomer = match.groups()
+        nuclide = (int(a), periodic_table[element], int(isomer or 0))
+    _nuclides[name] = nuclide
+    return nuclide
 
 
 # converter of fission yields into numbers : A, Z, probability
@@ -57,45 +348,98 @@ def read_fission_yields(a, z):
 
 def fission_fragments(nfy):
     """
-    Convert yields read from ENDF/BVIII.0 into lists of three
-    floats: mass, charge and probability for each fragment.
+    Convert yields read from ENDF/BVIII.0 into an array of fragments
+    (mass, charge and probability), isomeric states merged.
 
     Args:
-        nfy (dict): Neutron fission yields at a given energy.
+        nfy (array or dict): Neutron fission yields at a given energy
+        (NFY_DTYPE array, or dict of yields by nuclide name, e.g. from openmc).
 
     Returns:
-        ff (array): Fragments 5-uples [A,Z,P] with
-        A (int): Mass number of the fragment, 
-        Z (int): Charge number of the fragment,
-        P (float): Fragmentation probability.
+        ff (array): Fragments sorted by A and Z, array of NFY_DTYPE with fields
+        a (int): Mass number of the fragment, 
+        z (int): Charge number of the fragment,
+        yield (float): Fragmentation probability.
     """
 
-    # list of fission fragments and associated probability
-
-    ff = []
+    # yields already converted from the compact store
 
-    for nucleus, value in nfy.items():
+    if isinstance(nfy, np.ndarray):
+        return nfy
 
-        match = re.match(r"([A-Za-z]+)(\d+)", nucleus)
+    # fission fragments and associated probability
 
-        if match:
+    nuclides = [nuclide_from_name(name) for name in nfy]
+    listed = [k for k, nuclide in enumerate(nuclides) if nuclide is not None]
+    a_ff = np.array([nuclides[k][0] for k in listed], dtype=int)
+    z_ff = np.array([nuclides[k][1] for k in listed], dtype=int)
+    values = list(nfy.values())
+    p_ff = np.array(
+        [getattr(values[k], "nominal_value", values[k]) for k in listed], dtype=float
+    )
 
-            element, a = match.groups()
-            a = int(a)
-            z = int(periodic_table[element])
-            proba_float = value.n if hasattr(value, "nominal_value") else float(value)
-            ff.append([a, z, proba_float])
-    
     # merging isomeric (metastables) states
 
-    ff_isom_merged_dict = defaultdict(float)
+    keys, index = np.unique(a_ff * 1000 + z_ff, return_inverse=True)
+    ff = np.empty(keys.size, dtype=NFY_DTYPE)
+    ff["a"], ff["z"] = keys // 1000, keys % 1000
+    ff["yield"] = np.bincount(index, weights=p_ff, minlength=keys.size)
 
-    for A, Z, p in ff:
-        ff_isom_merged_dict[(A, Z)] += p
+    return ff
+
+
+# complementary fragments index
+
+
+def complementary_pairs(a, z, a_ff, z_ff):
+    """
+    Pairing of fission fragments with their complementary fragment
+    (mass and charge conservation), through a (Z, A) index of the fragments.
+
+    Args:
+        a (int): Mass number of the target.
+        z (int): Charge number of the target.
+        a_ff (int array): Mass numbers of the fragments.
+        z_ff (int array): Charge numbers of the fragments.
+
+    Returns:
+        light (int array): Index of the light fragment of each pair, -1 if not listed.
+        heavy (int array): Index of the heavy fragment of each pair, -1 if not listed
+        (or for symmetric fragmentations into two identical fragments).
+        ah (int array): Heavy fragment mass number of each pair.
+        zh (int array): Heavy fragment charge number of each pair.
+        al (int array): Light fragment mass number of each pair.
+        zl (int array): Light fragment charge number of each pair.
+    """
 
-    ff_isom_merged_list = [(A, Z, p) for (A, Z), p in sorted(ff_isom_merged_dict.items())]
+    a_ff, z_ff = np.asarray(a_ff, dtype=int), np.asarray(z_ff, dtype=int)
+    a_c, z_c = a + 1 - a_ff, z - z_ff # incident neutron: +1
 
-    return ff_isom_merged_list
+    # (Z, A) index of the fragments (-1 for fragments not listed)
+
+    index = np.full((z + 1, a + 2), -1)
+    inside = (z_ff >= 0) & (z_ff <= z) & (a_ff >= 0) & (a_ff <= a + 1)
+    index[z_ff[inside], a_ff[inside]] = np.flatnonzero(inside)
+    inside_c = (z_c >= 0) & (a_c >= 0)
+    partner = np.full(a_ff.size, -1)
+    partner[inside_c] = index[z_c[inside_c], a_c[inside_c]]
+
+    # one pair per light fragment, and per heavy fragment without listed light partner
+
+    is_light = (a_ff < a_c) | ((a_ff == a_c) & (z_ff <= z_c))
+    first = is_light | (partner == -1)
+    k = np.flatnonzero(first)
+    light = np.where(is_light[k], k, partner[k])
+    heavy = np.where(is_light[k], partner[k], k)
+    heavy[light == heavy] = -1
+
+    al = np.where(is_light[k], a_ff[k], a_c[k])
+    zl = np.where(is_light[k], z_ff[k], z_c[k])
+
+    order = np.lexsort((zl, al))
+    light, heavy, al, zl = light[order], heavy[order], al[order], zl[order]
+
+    return light, heavy, a + 1 - al, z - zl, al, zl
 
 
 # fission fragments coupling
@@ -103,29 +447,128 @@ def fission_fragments(nfy):
 
 def fission_fragments_coupled(a, z, nfy):
     """
-    Coupling of fission fragments by mass and charge conservation.
+    Coupling of fission fragments by mass and charge conservation. The
+    probability of a fragmentation is the average of the yields of its two
+    complementary fragments (a fragment whose partner is not listed counts for half).
 
     Args:
         a (int): Mass number of the target.
         z (int): Charge number of the target.
-        nfy (list): Neutron fission yields at a given energy.
+        nfy (array or dict): Neutron fission yields at a given energy.
 
     Returns:
-        ff (array): Coupled fission fragments 5-uples [Ah,Zh,Al,Zl,P] with
-              Ah (int): Heavy fragment mass number, 
-              Zh (int): Heavy fragment charge number,
-              Al (int): Light fragment mass number,
-              Zl (int): Light fragment charge number,
-              P (float): Fragmentation probability.
+        ff (array): Coupled fission fragments, array of FF_COUPLED_DTYPE with fields
+              ah (int): Heavy fragment mass number, 
+              zh (int): Heavy fragment charge number,
+              al (int): Light fragment mass number,
+              zl (int): Light fragment charge number,
+              p (float): Fragmentation probability.
     """
 
     ff = fission_fragments(nfy)
-    ff_coupled = []
+    a_ff, z_ff, y = ff["a"], ff["z"], ff["yield"]
+    light, heavy, ah, zh, al, zl = complementary_pairs(a, z, a_ff, z_ff)
 
-    for k in range(len(ff) // 2):
-        al, zl, p = ff[k]
-        ah = a + 1 - al # incident neutron: +1
-        zh = z - zl
-        ff_coupled.append([ah, zh, al, zl, p])
+    y = np.append(y, 0.0) # index -1: fragment not listed
+    ff_coupled = np.empty(light.size, dtype=FF_COUPLED_DTYPE)
+    ff_coupled["ah"], ff_coupled["zh"], ff_coupled["al"], ff_coupled["zl"] = ah, zh, al, zl
+    ff_coupled["p"] = 0.5 * (y[light] + y[heavy])
 
     return ff_coupled
+
+
+# fragments without complementary partner
+
+
+def unpaired_fission_fragments(a, z, nfy):
+    """
+    Fission fragments whose complementary fragment is not listed in the yields.
+
+    Args:
+        a (int): Mass number of the target.
+        z (int): Charge number of the target.
+        nfy (array or dict): Neutron fission yields at a given energy.
+
+    Returns:
+        ff (array): Unpaired fragments, array of NFY_DTYPE (fields a, z and yield).
+    """
+
+    ff = fission_fragments(nfy)
+    a_ff, z_ff = ff["a"], ff["z"]
+    light, heavy, _, _, al, zl = complementary_pairs(a, z, a_ff, z_ff)
+    symmetric = (2 * al == a + 1) & (2 * zl == z)
+    k = np.concatenate([light[(heavy == -1) & ~symmetric], heavy[light == -1]])
+    k = np.sort(k[k >= 0])
+
+    return ff[k]
+
+
+# reader of coupled fission fragments
+
+
+def read_fission_fragments_coupled(a, z):
+    """
+    Coupled fission fragments of a target nucleus for all available
+    incident energies (cached, see yields_cache_info).
+
+    Args:
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+
+    Returns:
+        energy_list (list): Incident energies (MeV).
+        ff_list (list): Coupled fission fragments for each energy, as read-only
+        arrays of FF_COUPLED_DTYPE (fields ah, zh, al, zl and p).
+    """
+
+    def build(filepath):
+        energy_list, nfy_list = read_fission_yields(a, z)
+        ff_list = []
+        with stage("coupling"):
+            for nfy in nfy_list:
+                ff = fission_fragments_coupled(a, z, nfy)
+                ff.flags.writeable = False
+                ff_list.append(ff)
+        return energy_list, ff_list
+
+    energy_list, ff_list = _cached("coupled", a, z, build)
+
+    return list(energy_list), list(ff_list)
+
+
+# reader of the pair yields of all incident energies
+
+
+def read_fission_pairs(a, z):
+    """
+    Coupled fission fragments of a target nucleus on a single index of pairs
+    (union of the fragmentations of all incident energies), with the
+    probabilities of all energies as one matrix (cached, see yields_cache_info).
+
+    Args:
+        a (int): Mass number of the target nucleus.
+        z (int): Charge number of the target nucleus.
+
+    Returns:
+        pairs (FissionPairs): Read-only arrays with
+              energies (float array): Incident energies (MeV),
+              ah, zh (int arrays): Heavy fragment mass and charge numbers of each pair,
+              al, zl (int arrays): Light fragment mass and charge numbers of each pair,
+              p (float array): Fragmentation probabilities (energies x pairs), zero for
+              pairs not listed at an energy.
+    """
+
+    def build(filepath):
+        with stage("read"):
+            store = _load_evaluation(filepath)
+        with stage("coupling"):
+            yields = np.nan_to_num(store["yields"], nan=0.0)
+            light, heavy, ah, zh, al, zl = complementary_pairs(a, z, store["a"], store["z"])
+            yields = np.column_stack([yields, np.zeros(yields.shape[0])]) # index -1: not listed
+            p = 0.5 * (yields[:, light] + yields[:, heavy])
+            pairs = FissionPairs(store["energies"].copy(), ah, zh, al, zl, p)
+        for array in pairs:
+            array.flags.writeable = False
+        return pairs
+
+    return _cached("pairs", a, z, build)
@@ -0,0 +1,15 @@
+""" Shared fixtures of the unitary tests """
+
+import pytest
+from ffdd.cache import CACHE_ENV
+
+# binary caches of the test session in a temporary directory (not in ~/.cache/ffdd)
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_dir(tmp_path_factory):
+    """Point the binary caches to a temporary directory for the whole session"""
+
+    path = tmp_path_factory.mktemp("ffdd-cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CACHE_ENV, str(path))
+        yield path
@@ -0,0 +1,43 @@
+""" Unitary test : fission averages as matrix-vector products """
+
+import pytest
+import numpy as np
+from ffdd.decay import multiplicities
+from ffdd.yields import read_fission_fragments_coupled
+from ffdd.tke import tke
+from ffdd.energy import q_value_array
+from ffdd.averages import fission_averages
+
+# test
+
+def test_averages():
+    """Check the averages of all energies against the per-energy computation"""
+
+    energies, ff_list = read_fission_fragments_coupled(235, 92)
+
+    for model in ['fong', 'edigy']:
+        averages = fission_averages(235, 92, beta=0.25, model=model, rt=1.1)
+        assert np.allclose(averages.energies, energies)
+
+        for k, (energy, ff) in enumerate(zip(energies, ff_list)):
+            nuh, nul, valid = multiplicities(
+                235, 92, energy, ff["ah"], ff["zh"], ff["al"], ff["zl"],
+                beta=0.25, model=model, rt=1.1,
+            )
+
+            # assert
+
+            assert averages.nubar[k] == pytest.approx(
+                np.average((nuh + nul)[valid], weights=ff["p"][valid]), rel=1e-12
+            )
+
+    # average TKE and TXE of the fragmentations with available masses
+
+    averages = fission_averages(235, 92, beta=0.25)
+    for k, (energy, ff) in enumerate(zip(energies, ff_list)):
+        q = q_value_array(235, 92, ff["ah"], ff["zh"], ff["al"], ff["zl"], energy)
+        tke_ff = tke(ff["ah"], ff["zh"], ff["al"], ff["zl"], 0.25)
+        valid = ~np.isnan(q)
+        assert averages.tke[k] == pytest.approx(np.average(tke_ff[valid], weights=ff["p"][valid]))
+        txe_ff = q - tke_ff
+        assert averages.txe[k] == pytest.approx(np.average(txe_ff[valid], weights=ff["p"][valid]))
@@ -0,0 +1,41 @@
+""" Unitary test : binary cache of nuclear data files """
+
+import numpy as np
+from ffdd.cache import cached_arrays
+
+# test
+
+def test_cache(tmp_path, monkeypatch):
+    """Check that the cache is built on first use and invalidated by the source content"""
+
+    monkeypatch.setenv("FFDD_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "data.txt"
+    source.write_text("1 2 3\n")
+    calls = []
+
+    def build(path):
+        calls.append(path)
+        return {"values": np.loadtxt(path)}
+
+    # first use builds the cache, second use reads it
+
+    first = cached_arrays("data", str(source), build)
+    second = cached_arrays("data", str(source), build)
+    assert len(calls) == 1
+    assert np.array_equal(first["values"], second["values"])
+
+    # modified source invalidates the cache
+
+    source.write_text("4 5 6\n")
+    third = cached_arrays("data", str(source), build)
+    assert len(calls) == 2
+    assert np.array_equal(third["values"], [4, 5, 6])
+    assert len(list((tmp_path / "cache").glob("data-*.npz"))) == 1
+
+    # corrupt (truncated) cache entry is rebuilt
+
+    entry = next((tmp_path / "cache").glob("data-*.npz"))
+    entry.write_bytes(entry.read_bytes()[:40])
+    fourth = cached_arrays("data", str(source), build)
+    assert len(calls) == 3
+    assert np.array_equal(fourth["values"], [4, 5, 6])
@@ -0,0 +1,41 @@
+""" Unitary test : calibration of the model parameters """
+
+import pytest
+from ffdd.decay import nubar
+from ffdd.calibrate import calibrate
+
+# test
+
+def test_calibrate():
+    """Check that the calibration recovers the parameters of synthetic references"""
+
+    references = {
+        (235, 92): nubar(235, 92, beta=0.22, rt=1.1),
+        (239, 94): nubar(239, 94, beta=0.22, rt=1.1),
+    }
+    result = calibrate(references, params=('beta', 'rt'), x0={'beta': 0.18, 'rt': 1.0})
+
+    # assert
+
+    assert result.converged
+    assert result.misfit < 1e-3
+    assert result.params['beta'] == pytest.approx(0.22, abs=0.01)
+    assert result.params['rt'] == pytest.approx(1.1, abs=0.02)
+    assert result.params['ekin'] == 2.0
+
+    # invalid parameters
+
+    with pytest.raises(ValueError):
+        calibrate(references, params=('beta',), x0={'bta': 0.2})
+    with pytest.raises(ValueError):
+        calibrate(references, params=('beta',), fixed={'rt': 1.0}, x0={'rt': 1.1})
+    with pytest.raises(ValueError):
+        calibrate(references, params=('beta', 'rt'), fixed={'rt': 1.0})
+    with pytest.raises(ValueError):
+        calibrate(references, params=('beta',), bounds={'beta': (0.6, 0.0)})
+    with pytest.raises(ValueError):
+        calibrate(references, params=())
+    with pytest.raises(ValueError):
+        calibrate(references, params=('beta', 'beta'))
+    with pytest.raises(ValueError):
+        calibrate(references, params=('beta',), x0={'beta': 0.8})
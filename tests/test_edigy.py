@@ -0,0 +1,38 @@
+""" Unitary test : pairing corrections of the von Edigy model """
+
+import pytest
+import numpy as np
+from ffdd.mass import nuclear_mass
+from ffdd.sepn import sepn
+from ffdd.energy import edigy, edigy_array, level_density_table, EDIGY_P, EDIGY_Q, EDIGY_R
+
+# test
+
+def test_edigy_pairing():
+    """Check that the light fragment pairing correction follows the heavy fragment parities"""
+
+    # americium-241 fission: 139Cs (odd A, odd Z) and 103Zr (odd A, even Z),
+    # thorium-232 fission: 138I (even A, odd Z) and 95Rb (odd A, odd Z)
+
+    for ah, zh, al, zl, heavy_odd in [(139, 55, 103, 40, 1), (138, 53, 95, 37, 0)]:
+
+        pdl = 0.5 * pow(-1, zl) * (
+            -nuclear_mass(al + 2, zl + 1) + 2 * nuclear_mass(al, zl) - nuclear_mass(al - 2, zl - 1)
+        )
+        deltal = - 0.5 * pdl if heavy_odd else 0.0
+        delta, _ = level_density_table()
+
+        # assert
+
+        assert delta[heavy_odd, zl, al - zl] == pytest.approx(deltal, rel=1e-12)
+
+        pdh = 0.5 * pow(-1, zh) * (
+            -nuclear_mass(ah + 2, zh + 1) + 2 * nuclear_mass(ah, zh) - nuclear_mass(ah - 2, zh - 1)
+        )
+        deltah = - 0.5 * pdh if heavy_odd else 0.0
+        dl = al * (EDIGY_P + EDIGY_Q * (sepn(al, zl) - deltal) + EDIGY_R * al)
+        dh = ah * (EDIGY_P + EDIGY_Q * (sepn(ah, zh) - deltah) + EDIGY_R * ah)
+        assert edigy(ah, zh, al, zl) == pytest.approx(dl / (dl + dh), rel=1e-12)
+        assert edigy_array(np.array([ah]), np.array([zh]), np.array([al]), np.array([zl]))[0] == (
+            edigy(ah, zh, al, zl)
+        )
@@ -0,0 +1,25 @@
+""" Unitary test : ENDF-6 fission yields reader """
+
+import pytest
+import numpy as np
+from ffdd.endf import iter_nfy_records, read_nfy_records
+
+# test
+
+def test_endf():
+    """Check the independent yields records of 235U (3 energies, yields summing to 2)"""
+
+    filepath = "./ffdd/data/yields/nfy-092_U_235.endf"
+    records = read_nfy_records(filepath)
+
+    # streaming and array readers
+
+    assert len(records) == sum(1 for _ in iter_nfy_records(filepath))
+    assert np.unique(records["energy"]).tolist() == [0.0253, 5e5, 1.4e7]
+
+    # two fragments per fission
+
+    for energy in np.unique(records["energy"]):
+        selection = records[records["energy"] == energy]
+        assert selection["yield"].sum() == pytest.approx(2.0, rel=1e-3)
+        assert np.all(selection["unc"] >= 0)
@@ -0,0 +1,35 @@
+""" Unitary test : lightweight import of ffdd """
+
+import os
+import sys
+import subprocess
+
+# test
+
+def test_import(tmp_path):
+    """Check that importing ffdd loads no nuclear data table and no heavy dependency"""
+
+    code = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        "import ffdd.decay, ffdd.sweep, ffdd.prepared, ffdd.kernels\n"
+        "t = time.perf_counter() - t\n"
+        "from ffdd.mass import load_mass_table\n"
+        "from ffdd.sepn import load_s1n_table\n"
+        "print(load_mass_table.cache_info().currsize + load_s1n_table.cache_info().currsize)\n"
+        "heavy = ('pandas', 'openmc', 'numba', 'matplotlib', 'scipy')\n"
+        "print(*[m for m in heavy if m in sys.modules])\n"
+        "print(t)\n"
+    )
+    env = dict(os.environ, FFDD_CACHE_DIR=str(tmp_path / "cache"))
+    out = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    loaded, heavy, seconds = out.stdout.split("\n")[:3]
+
+    # assert
+
+    assert loaded == "0"
+    assert heavy == ""
+    assert not (tmp_path / "cache").exists()
+    assert float(seconds) < 2.0
@@ -0,0 +1,37 @@
+""" Unitary test : instrumentation of nubar """
+
+import numpy as np
+from ffdd.decay import nubar
+from ffdd.yields import read_fission_pairs, yields_cache_clear
+from ffdd.instrument import instrument
+
+# test
+
+def test_instrument():
+    """Check the stages and counters reported by the instrumentation of nubar"""
+
+    yields_cache_clear()
+    reported = []
+    with instrument(callback=reported.append) as stats:
+        nubar(235, 92, model='edigy')
+
+    # assert
+
+    assert reported == [stats]
+    assert set(stats.times) == {'read', 'coupling', 'q_value', 'tke', 'sharing', 'cascade'}
+
+    listed = int(np.count_nonzero(read_fission_pairs(235, 92).p > 0))
+    assert stats.counts['fragmentations'] == listed
+    skipped = stats.counts['skipped_q_value'] + stats.counts['skipped_sharing']
+    assert skipped < stats.counts['fragmentations']
+
+    # nothing is recorded outside of the context
+
+    nubar(235, 92)
+    assert stats.counts['fragmentations'] == listed
+
+    # a cached evaluation is not read again
+
+    with instrument() as stats:
+        nubar(235, 92, model='edigy')
+    assert 'read' not in stats.times and 'cascade' in stats.times
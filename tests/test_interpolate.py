@@ -0,0 +1,68 @@
+""" Unitary test : interpolation of the yields between incident energies """
+
+import pytest
+import numpy as np
+from ffdd.decay import nubar
+from ffdd.yields import read_fission_fragments_coupled
+from ffdd.interpolate import (
+    interpolate_pairs,
+    interpolate_fission_fragments_coupled,
+    nubar_interpolated,
+)
+
+# test
+
+def test_interpolate():
+    """Check the interpolated yields and nubar at and between the tabulated energies"""
+
+    energies, nu = nubar(235, 92)
+
+    # tabulated energies are reproduced
+
+    assert nubar_interpolated(235, 92, energies) == pytest.approx(nu)
+
+    # linear interpolation of the yields, constant beyond the tabulated range
+
+    grid = np.linspace(0.0, 20.0, 201)
+    pairs = interpolate_pairs(235, 92, grid)
+    w = (7.0 - energies[1]) / (energies[2] - energies[1])
+    tabulated = interpolate_pairs(235, 92, energies).p
+    assert pairs.p.shape == (201, pairs.ah.size)
+    assert np.allclose(pairs.p[70], (1 - w) * tabulated[1] + w * tabulated[2])
+    assert np.allclose(pairs.p[-1], tabulated[2])
+
+    # smooth curve on the grid
+
+    nu_grid = nubar_interpolated(235, 92, grid)
+    assert nu_grid.shape == grid.shape
+    assert nu_grid[0] == pytest.approx(nu[0], abs=1e-6)
+    assert np.all(np.diff(nu_grid[grid <= 14.0]) > -0.05)
+
+
+def test_interpolate_coupled():
+    """Check the interpolated coupled fragments at and between the tabulated energies"""
+
+    energies, ff_list = read_fission_fragments_coupled(235, 92)
+    fields = ["ah", "zh", "al", "zl"]
+
+    def table(ff):
+        ff = np.sort(ff[ff["p"] > 0], order=fields)
+        return {pair: p for pair, p in zip(ff[fields].tolist(), ff["p"].tolist())}
+
+    # tabulated energies: the coupled fragments with a non-zero probability
+
+    for energy, ff in zip(energies, ff_list):
+
+        # assert
+
+        assert table(interpolate_fission_fragments_coupled(235, 92, energy)) == table(ff)
+
+    # between two energies: linear combination, union of the fragmentations
+
+    w = (7.0 - energies[1]) / (energies[2] - energies[1])
+    lower, upper = table(ff_list[1]), table(ff_list[2])
+    ff = interpolate_fission_fragments_coupled(235, 92, 7.0)
+    assert np.all(ff["p"] > 0)
+    assert set(table(ff)) == set(lower) | set(upper)
+    for pair, p in table(ff).items():
+        assert p == pytest.approx((1 - w) * lower.get(pair, 0.0) + w * upper.get(pair, 0.0))
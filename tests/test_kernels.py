@@ -0,0 +1,50 @@
+""" Unitary test : compiled kernels against the NumPy implementations """
+
+import numpy as np
+from ffdd import kernels
+from ffdd.decay import nubar, decay_many
+from ffdd.tke import tke
+from ffdd.energy import txe_sharing_array
+from ffdd.prepared import prepare_fragmentation
+from ffdd.yields import yields_cache_clear
+
+# test
+
+def test_kernels(monkeypatch):
+    """Check that the kernels (compiled or plain Python) give identical multiplicities"""
+
+    prepared = prepare_fragmentation(235, 92)
+    ah, zh, al, zl = prepared.ah, prepared.zh, prepared.al, prepared.zl
+    txe = prepared.txe(np.array([[0.0], [5.0], [20.0]]), beta=0.2)
+
+    # NumPy implementations
+
+    monkeypatch.setattr(kernels, "ENABLED", False)
+    tke_np = tke(ah, zh, al, zl, 0.2)
+    xeh_np, xel_np = txe_sharing_array(txe, ah, zh, al, zl, model='edigy', rt=1.1)
+    nuh_np, residual_np = decay_many(ah, zh, xeh_np, ekin=1.5)
+    yields_cache_clear()
+    nu_np = nubar(235, 92, model='edigy')
+    xeh_prepared_np, _ = prepare_fragmentation(235, 92, 'edigy').excitation_energies(5.0, rt=1.1)
+
+    # kernels
+
+    monkeypatch.setattr(kernels, "ENABLED", True)
+    xeh, xel = txe_sharing_array(txe, ah, zh, al, zl, model='edigy', rt=1.1)
+    nuh, residual = decay_many(ah, zh, xeh, ekin=1.5)
+
+    # full computation with the prepared fragmentations built again with the kernels
+
+    yields_cache_clear()
+    nu = nubar(235, 92, model='edigy')
+    xeh_prepared, _ = prepare_fragmentation(235, 92, 'edigy').excitation_energies(5.0, rt=1.1)
+
+    # assert
+
+    assert np.array_equal(tke(ah, zh, al, zl, 0.2), tke_np)
+    assert np.array_equal(xeh, xeh_np, equal_nan=True)
+    assert np.array_equal(xel, xel_np, equal_nan=True)
+    assert np.array_equal(nuh, nuh_np)
+    assert np.array_equal(residual, residual_np, equal_nan=True)
+    assert np.array_equal(xeh_prepared, xeh_prepared_np, equal_nan=True)
+    assert nu == nu_np
@@ -0,0 +1,38 @@
+""" Unitary test : Monte Carlo simulation of fission events """
+
+import pytest
+import numpy as np
+from ffdd.decay import nubar
+from ffdd.montecarlo import sample_events
+
+# test
+
+def test_montecarlo():
+    """Check batches, reproducibility and the deterministic limit of the Monte Carlo mode"""
+
+    batches = list(
+        sample_events(235, 92, 250000, energy=0.5, sigma_tke=0.0, batch_size=100000, seed=1)
+    )
+    assert [len(events) for events in batches] == [100000, 100000, 50000]
+
+    # mass and charge conservation
+
+    events = np.concatenate(batches)
+    assert np.all(events["ah"] + events["al"] == 236)
+    assert np.all(events["zh"] + events["zl"] == 92)
+
+    # without fluctuations, the average multiplicity is the deterministic one
+
+    energies, nu = nubar(235, 92)
+    nu_mc = np.mean(events["nuh"] + events["nul"])
+    assert nu_mc == pytest.approx(nu[energies.index(0.5)], abs=0.02)
+
+    # same seed, same events
+
+    again = next(sample_events(235, 92, 1000, energy=0.5, seed=2))
+    assert np.array_equal(again, next(sample_events(235, 92, 1000, energy=0.5, seed=2)))
+
+    # unknown energy sharing model
+
+    with pytest.raises(ValueError):
+        next(sample_events(235, 92, 1000, model='fng'))
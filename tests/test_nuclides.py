@@ -0,0 +1,23 @@
+""" Unitary test : nuclide names and fragments arrays """
+
+import numpy as np
+from ffdd.yields import nuclide_from_name, fission_fragments
+
+# test
+
+def test_nuclides():
+    """Check the nuclide names lookup and the merging of isomeric states"""
+
+    assert nuclide_from_name("Kr93") == (93, 36, 0)
+    assert nuclide_from_name("Ag110_m1") == (110, 47, 1)
+    assert nuclide_from_name("total") is None
+
+    # dict of yields by nuclide name
+
+    ff = fission_fragments({"Sn130": 0.25, "Ag110_m1": 0.5, "Ag110": 0.25, "Kr93": 0.125})
+
+    # assert
+
+    assert ff["a"].tolist() == [93, 110, 130]
+    assert ff["z"].tolist() == [36, 47, 50]
+    assert np.allclose(ff["yield"], [0.125, 0.75, 0.25])
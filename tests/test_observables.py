@@ -0,0 +1,42 @@
+""" Unitary test : neutron emissions observables """
+
+import pytest
+import numpy as np
+from ffdd.decay import nubar, nubar_results
+from ffdd.observables import NubarResult
+
+# test
+
+def test_observables():
+    """Check the consistency of the observables with the average multiplicity"""
+
+    for model in ['fong', 'edigy']:
+
+        energies, nu = nubar(238, 92, model=model)
+        energies_results, results = nubar_results(238, 92, model=model)
+        assert energies_results == energies
+
+        for nu_energy, result in zip(nu, results):
+
+            # assert
+
+            assert result.nubar == pytest.approx(nu_energy)
+            assert result.nubar_heavy + result.nubar_light == pytest.approx(nu_energy)
+            assert result.p_nu.sum() == pytest.approx(1.0)
+            assert np.dot(np.arange(result.p_nu.size), result.p_nu) == pytest.approx(nu_energy)
+            assert result.nu_a[0].tolist() == sorted(set(result.ah) | set(result.al))
+
+
+def test_heavy_light_ratio():
+    """Check the heavy/light ratio when the light fragments emit no neutron"""
+
+    fragments = [np.array([140, 136]), np.array([54, 52]), np.array([96, 100]), np.array([38, 40])]
+    p = np.array([0.5, 0.5])
+    zeros = np.zeros(2, dtype=np.int16)
+
+    # assert
+
+    result = NubarResult(0.0, *fragments, p, np.array([1, 2]), np.array([1, 0]))
+    assert result.heavy_light_ratio == 3.0
+    assert NubarResult(0.0, *fragments, p, np.array([1, 2]), zeros).heavy_light_ratio == np.inf
+    assert np.isnan(NubarResult(0.0, *fragments, p, zeros, zeros).heavy_light_ratio)
@@ -0,0 +1,41 @@
+""" Unitary test : complementary fragments pairing """
+
+import pytest
+from ffdd.yields import (
+    read_fission_yields,
+    fission_fragments,
+    fission_fragments_coupled,
+    unpaired_fission_fragments,
+)
+
+# test
+
+def test_pairing():
+    """Check that each fragmentation merges the yields of its two complementary fragments"""
+
+    a_target, z_target = 238, 92
+    _, nfy_list = read_fission_yields(a_target, z_target)
+
+    for nfy in nfy_list:
+
+        yields = {(a, z): p for a, z, p in fission_fragments(nfy)}
+        ff = fission_fragments_coupled(a_target, z_target, nfy)
+        unpaired = unpaired_fission_fragments(a_target, z_target, nfy)
+
+        # every fragment belongs to exactly one fragmentation
+
+        fragments = [(ah, zh) for ah, zh in zip(ff["ah"], ff["zh"])]
+        fragments += [(al, zl) for al, zl in zip(ff["al"], ff["zl"])]
+        assert set(fragments) >= set(yields)
+
+        # assert
+
+        for ah, zh, al, zl, p in ff:
+            assert ah >= al
+            p_ref = yields.get((al, zl), 0.0)
+            if (ah, zh) != (al, zl):
+                p_ref += yields.get((ah, zh), 0.0)
+            assert p == pytest.approx(0.5 * p_ref)
+
+        for a, z, _ in unpaired:
+            assert (a_target + 1 - a, z_target - z) not in yields
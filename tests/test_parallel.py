@@ -0,0 +1,60 @@
+""" Unitary test : process-pool driver of nubar """
+
+import pytest
+import numpy as np
+from ffdd.decay import nubar
+from concurrent.futures import ProcessPoolExecutor
+from ffdd import parallel
+from ffdd.parallel import nubar_many, iter_nubar, work_units
+
+# test
+
+def test_parallel():
+    """Check that the process-pool scan is ordered and matches nubar"""
+
+    targets = [(235, 92), (238, 92)]
+    records = nubar_many(targets, beta=[0.15, 0.2], model='fong', workers=2)
+    assert records == nubar_many(targets, beta=[0.15, 0.2], model='fong', workers=1)
+
+    # deterministic order: targets, parameters, energies
+
+    k = 0
+    for a_target, z_target in targets:
+        for beta in [0.15, 0.2]:
+            energies, nu = nubar(a_target, z_target, beta=beta, model='fong')
+            for energy, nu_energy in zip(energies, nu):
+
+                # assert
+
+                assert (records[k].a_target, records[k].z_target) == (a_target, z_target)
+                assert (records[k].beta, records[k].energy) == (beta, energy)
+                assert records[k].nubar == pytest.approx(nu_energy)
+                k += 1
+
+    assert k == len(records)
+
+    # numpy scalars are single parameter values
+
+    units = work_units([(235, 92)], ekin=np.float32(2.0), beta=np.float64(0.2), rt=np.int64(1))
+    assert {unit[3] for unit in units} == {(np.float32(2.0), 0.2, 'fong', 1)}
+
+
+def test_parallel_workers(monkeypatch):
+    """Check that no more worker processes than work units are started"""
+
+    sizes = []
+
+    class Pool(ProcessPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            sizes.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", Pool)
+    targets = [(235, 92)]
+    n = len(work_units(targets, model='fong'))
+    records = nubar_many(targets, model='fong', workers=n + 8)
+    assert sorted(iter_nubar(targets, model='fong', workers=n + 8)) == sorted(records)
+
+    # assert
+
+    assert n > 1 and sizes == [n, n]
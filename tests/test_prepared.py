@@ -0,0 +1,35 @@
+""" Unitary test : energy-independent precomputation of the fragmentations """
+
+import numpy as np
+from ffdd.yields import read_fission_pairs
+from ffdd.decay import multiplicities
+from ffdd.prepared import prepare_fragmentation
+
+# test
+
+def test_prepared():
+    """Check that prepared fragmentations give the multiplicities of the full computation"""
+
+    pairs = read_fission_pairs(239, 94)
+
+    for model in ['fong', 'edigy']:
+        prepared = prepare_fragmentation(239, 94, model)
+        assert prepare_fragmentation(239, 94, model) is prepared
+
+        for energy in [0.0, 0.5, 5.0]:
+            expected = multiplicities(
+                239, 94, energy, pairs.ah, pairs.zh, pairs.al, pairs.zl,
+                beta=0.25, model=model, rt=1.1,
+            )
+            nuh, nul, valid = prepared.multiplicities(energy, beta=0.25, rt=1.1)
+
+            # assert
+
+            assert np.array_equal(valid, expected[2])
+            assert np.array_equal(nuh[valid], expected[0][valid])
+            assert np.array_equal(nul[valid], expected[1][valid])
+
+        # several energies at once
+
+        nuh, nul, valid = prepared.multiplicities(np.array([[0.5], [5.0]]), beta=0.25, rt=1.1)
+        assert nuh.shape == (2, pairs.ah.size)
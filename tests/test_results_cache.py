@@ -0,0 +1,37 @@
+""" Unitary test : results cache of nubar on disk """
+
+import os
+from ffdd.decay import nubar
+from ffdd.cache import cached_result
+
+# test
+
+def test_results_cache(tmp_path, monkeypatch):
+    """Check that cached results match nubar, are keyed by parameters and evicted by size"""
+
+    monkeypatch.setenv("FFDD_CACHE_DIR", str(tmp_path))
+    energies, nu = nubar(235, 92, beta=0.15)
+
+    # first call stores the result, second call reads it
+
+    assert nubar(235, 92, beta=0.15, cache=True) == (energies, [float(n) for n in nu])
+    assert nubar(235, 92, beta=0.15, cache=True) == (energies, [float(n) for n in nu])
+    assert nubar(235, 92, beta=0.25, cache=True)[1] != nu
+    assert len(os.listdir(tmp_path / "results")) == 2
+
+    # computation is skipped on a hit
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [1.0, 2.0]
+
+    assert cached_result("test", {"x": 1}, [], compute) == [1.0, 2.0]
+    assert cached_result("test", {"x": 1}, [], compute) == [1.0, 2.0]
+    assert len(calls) == 1
+
+    # least recently used results are evicted beyond the size limit
+
+    cached_result("test", {"x": 2}, [], compute, max_bytes=0)
+    assert os.listdir(tmp_path / "results") == []
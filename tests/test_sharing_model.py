@@ -0,0 +1,33 @@
+""" Unitary test : validation of the energy sharing model """
+
+import pytest
+from ffdd.decay import nubar
+from ffdd.sweep import nubar_grid
+from ffdd.averages import fission_averages
+from ffdd.prepared import prepare_fragmentation
+from ffdd.energy import txe_sharing
+from ffdd.yields import yields_cache_info
+
+# test
+
+def test_sharing_model():
+    """Check that unknown energy sharing models raise ValueError instead of running edigy"""
+
+    nubar_grid(235, 92)
+    nubar(235, 92)
+    currsize = yields_cache_info().currsize
+
+    with pytest.raises(ValueError, match="Fong"):
+        nubar_grid(235, 92, model=('Fong',))
+    with pytest.raises(ValueError, match="typo"):
+        fission_averages(235, 92, model='typo')
+    with pytest.raises(ValueError):
+        prepare_fragmentation(235, 92, 'typo')
+    with pytest.raises(ValueError):
+        nubar(235, 92, model='foo')
+    with pytest.raises(ValueError):
+        txe_sharing(20.0, 140, 54, 96, 38, model='foo')
+
+    # nothing is cached for unknown models
+
+    assert yields_cache_info().currsize == currsize
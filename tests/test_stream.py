@@ -0,0 +1,50 @@
+""" Unitary test : streaming of nubar results """
+
+import asyncio
+from ffdd.yields import yields_cache_clear
+from ffdd.parallel import nubar_many, iter_nubar, aiter_nubar
+
+# test
+
+def test_stream():
+    """Check that the streamed results (serial, pool and asyncio) match nubar_many"""
+
+    targets = [(235, 92), (239, 94)]
+    records = nubar_many(targets, beta=[0.15, 0.2], workers=1)
+
+    # serial stream in the order of the work units, pool stream in any order
+
+    assert list(iter_nubar(targets, beta=[0.15, 0.2], workers=1)) == records
+    assert sorted(iter_nubar(targets, beta=[0.15, 0.2], workers=2)) == sorted(records)
+
+    # early stop of the stream
+
+    stream = iter_nubar(targets, beta=[0.15, 0.2], workers=2)
+    first = next(stream)
+    stream.close()
+    assert first in records
+
+    # asynchronous stream
+
+    async def consume():
+        return [record async for record in aiter_nubar(targets, beta=[0.15, 0.2], workers=1)]
+
+    assert asyncio.run(consume()) == records
+
+    # cancellation while a result is being computed (evaluations read again)
+
+    yields_cache_clear()
+
+    async def cancel():
+        stream = aiter_nubar(targets, beta=[0.15, 0.2], workers=1)
+        task = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await stream.aclose()
+        return [record async for record in aiter_nubar(targets, beta=[0.15, 0.2])]
+
+    assert sorted(asyncio.run(cancel())) == sorted(records)
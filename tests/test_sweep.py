@@ -0,0 +1,27 @@
+""" Unitary test : multi-parameter sweep of nubar """
+
+import pytest
+from ffdd.decay import nubar
+from ffdd.sweep import nubar_grid
+
+# test
+
+def test_sweep():
+    """Check that the nubar grid matches independent nubar calls"""
+
+    grid = nubar_grid(
+        239, 94, beta=[0.15, 0.25], ekin=[1.5, 2.0], rt=[1, 1.2], model=['fong', 'edigy']
+    )
+    assert grid.values.shape == (4, 2, 2, 2, 2)
+
+    for ib, beta in enumerate(grid.coords['beta']):
+        for ie, ekin in enumerate(grid.coords['ekin']):
+            for ir, rt in enumerate(grid.coords['rt']):
+                for im, model in enumerate(grid.coords['model']):
+
+                    energies, nu = nubar(239, 94, ekin=ekin, beta=beta, model=model, rt=rt)
+
+                    # assert
+
+                    assert grid.coords['energy'].tolist() == energies
+                    assert grid.values[:, ib, ie, ir, im] == pytest.approx(nu, rel=1e-12)
@@ -0,0 +1,40 @@
+""" Unitary test : dense (Z, N) tables of nuclear masses and neutron separation energies """
+
+import pytest
+import numpy as np
+from ffdd.mass import nuclear_mass, nuclear_mass_array, load_mass_table, U_MEV
+from ffdd.sepn import sepn, sepn_array, load_s1n_table
+
+# test
+
+def test_tables():
+    """Check the table lookups against the AME2020 and LANL files"""
+
+    # mass excesses of 16O and 235U, S1n of 132Sn and 235U (MeV)
+
+    assert load_mass_table()[8, 8] == pytest.approx(-4.73700217, rel=1e-12)
+    assert nuclear_mass(235, 92) == pytest.approx(40.918782 + 235 * U_MEV, rel=1e-12)
+    assert sepn(132, 50) == 6.92
+    assert load_s1n_table()[92, 143] == sepn(235, 92) == 5.25
+
+    # vectorized lookups, NaN for estimated (241U mass), unknown (16O S1n) or out of table nuclei
+
+    a = np.array([235, 241, 16, 400, 1])
+    z = np.array([92, 92, 8, 92, 200])
+    m = nuclear_mass_array(a, z)
+    sn = sepn_array(a, z)
+
+    # assert
+
+    assert m[0] == nuclear_mass(235, 92)
+    assert np.isnan(m[1:]).tolist() == [True, False, True, True]
+    assert sn[:2].tolist() == [5.25, 4.48] # 241U listed in the LANL file
+    assert np.isnan(sn[2:]).all()
+    assert nuclear_mass_array(16, 8) == nuclear_mass(16, 8)
+
+    # scalar functions: KeyError for a missing mass, NaN for a missing S1n
+
+    for a_missing, z_missing in [(241, 92), (400, 92), (1, 200)]:
+        with pytest.raises(KeyError):
+            nuclear_mass(a_missing, z_missing)
+    assert np.isnan(sepn(16, 8)) and np.isnan(sepn(400, 92))
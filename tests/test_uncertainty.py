@@ -0,0 +1,31 @@
+""" Unitary test : propagation of the yields uncertainties """
+
+import numpy as np
+from ffdd.decay import nubar
+from ffdd.uncertainty import nubar_uncertainty
+
+# test
+
+def test_uncertainty():
+    """Check the nominal multiplicity, the statistics and the reproducibility of the replicas"""
+
+    result = nubar_uncertainty(235, 92, n_samples=2000, batch_size=300, seed=1)
+    energies, nu = nubar(235, 92)
+
+    # nominal yields give the deterministic multiplicity
+
+    assert np.allclose(result.energies, energies)
+    assert np.allclose(result.nominal, nu)
+
+    # statistics of the replicas
+
+    assert result.samples.shape == (2000, len(energies))
+    assert result.quantiles.shape == (3, len(energies))
+    assert np.all(result.std > 0)
+    assert np.allclose(result.mean, nu, atol=3 * result.std)
+    assert np.all(np.diff(result.quantiles, axis=0) > 0)
+
+    # same seed, same replicas
+
+    again = nubar_uncertainty(235, 92, n_samples=2000, seed=1)
+    assert np.array_equal(again.samples, result.samples)
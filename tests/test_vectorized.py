@@ -0,0 +1,70 @@
+""" Unitary test : vectorized decay of fragmentations """
+
+import pytest
+import numpy as np
+from ffdd.decay import decay, decay_many, multiplicities
+from ffdd.energy import q_value, txe_sharing
+from ffdd.tke import tke
+
+# test
+
+def test_vectorized():
+    """Check that the vectorized fragmentations decay matches the fragment by fragment one"""
+
+    # uranium-235 fragmentations around the most probable charges
+
+    a_target, z_target, energy = 235, 92, 0.5
+    ah, zh, al, zl = [], [], [], []
+    for a in range(80, 118):
+        z0 = round(a * z_target / (a_target + 1))
+        for z in range(z0 - 3, z0 + 4):
+            ah.append(a_target + 1 - a)
+            zh.append(z_target - z)
+            al.append(a)
+            zl.append(z)
+
+    for model in ['fong', 'edigy']:
+
+        nuh, nul, valid = multiplicities(
+            a_target, z_target, energy, ah, zh, al, zl, ekin=2.0, beta=0.2, model=model, rt=1.1
+        )
+
+        # fragment by fragment reference
+
+        for k in range(len(ah)):
+
+            try:
+                q = q_value(a_target, z_target, ah[k], zh[k], al[k], zl[k], energy)
+                txe = q - tke(ah[k], zh[k], al[k], zl[k], 0.2)
+                xeh, xel = txe_sharing(txe, ah[k], zh[k], al[k], zl[k], model=model, rt=1.1)
+            except KeyError:
+                assert not valid[k]
+                continue
+
+            # assert
+
+            assert valid[k]
+            assert nuh[k] == decay(ah[k], zh[k], xeh, ekin=2.0)[0]
+            assert nul[k] == decay(al[k], zl[k], xel, ekin=2.0)[0]
+
+
+def test_threshold_cascade():
+    """Check that the threshold tables cascade matches the sequential neutron evaporation"""
+
+    rng = np.random.default_rng(0)
+    a = rng.integers(70, 170, 2000)
+    z = np.round(a * 92 / 236).astype(int) + rng.integers(-4, 5, 2000)
+    xe = rng.uniform(-5.0, 80.0, 2000)
+
+    for ekin in [0.5, 2.0]:
+
+        nu, residual = decay_many(a, z, xe, ekin)
+
+        for k in range(len(a)):
+
+            nu_ref, residual_ref = decay(int(a[k]), int(z[k]), float(xe[k]), ekin=ekin)
+
+            # assert
+
+            assert nu[k] == nu_ref
+            assert residual[k] == pytest.approx(residual_ref, abs=1e-9)
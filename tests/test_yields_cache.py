@@ -0,0 +1,46 @@
+""" Unitary test : LRU cache of evaluations and coupled fragmentations """
+
+import pytest
+from ffdd.yields import (
+    read_fission_yields,
+    read_fission_fragments_coupled,
+    yields_cache_info,
+    yields_cache_clear,
+    set_yields_cache_size,
+)
+
+# test
+
+def test_yields_cache():
+    """Check hits, eviction and read-only entries of the yields LRU cache"""
+
+    yields_cache_clear()
+    set_yields_cache_size(2)
+
+    try:
+
+        # second read of the same evaluation is a hit
+
+        _, nfy_list = read_fission_yields(235, 92)
+        read_fission_yields(235, 92)
+        info = yields_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+        # coupled fragmentations reuse the cached evaluation
+
+        read_fission_fragments_coupled(235, 92)
+        assert yields_cache_info().currsize == 2
+
+        # least recently used entry is evicted
+
+        read_fission_yields(238, 92)
+        assert yields_cache_info().currsize == 2
+
+        # cached arrays cannot be modified
+
+        with pytest.raises(ValueError):
+            nfy_list[0]["yield"][0] = 1.0
+
+    finally:
+        set_yields_cache_size()
+        yields_cache_clear()
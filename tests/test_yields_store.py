@@ -0,0 +1,48 @@
+""" Unitary test : conversion of ENDF evaluations into compact yield stores """
+
+import math
+import numpy as np
+from ffdd.endf import iter_nfy_records
+from ffdd.yields import _convert_evaluation, _yields_file, convert_fission_yields
+
+# test
+
+def test_yields_store(tmp_path, monkeypatch):
+    """Check the isomer merging of the yield store against a direct reading of the ENDF file"""
+
+    filepath = _yields_file(235, 92)
+    store = _convert_evaluation(filepath)
+
+    # direct reading: yields summed and uncertainties summed in quadrature over isomers
+
+    direct, isomers = {}, 0
+    for energy, za, isomer, y, dy in iter_nfy_records(filepath):
+        z_ff, a_ff = divmod(za, 1000)
+        y_sum, var_sum = direct.get((energy * 1e-6, a_ff, z_ff), (0.0, 0.0))
+        direct[(energy * 1e-6, a_ff, z_ff)] = (y_sum + y, var_sum + dy**2)
+        isomers += isomer > 0
+    assert isomers > 0
+
+    # assert
+
+    assert store["energies"].tolist() == sorted({key[0] for key in direct})
+    assert set(zip(store["a"].tolist(), store["z"].tolist())) == {key[1:] for key in direct}
+    assert np.all(np.diff(store["a"] * 1000 + store["z"]) > 0)
+    assert len(direct) < store["yields"].size # some fragments are not listed at all energies
+
+    for i, energy in enumerate(store["energies"]):
+        for j, (a_ff, z_ff) in enumerate(zip(store["a"], store["z"])):
+            key = (energy, int(a_ff), int(z_ff))
+            if key in direct:
+                y, var = direct[key]
+                assert math.isclose(store["yields"][i, j], y, rel_tol=1e-12)
+                assert math.isclose(store["unc"][i, j], math.sqrt(var), rel_tol=1e-12)
+            else:
+                assert np.isnan(store["yields"][i, j]) and np.isnan(store["unc"][i, j])
+
+    # conversion of the whole library into the cache directory
+
+    monkeypatch.setenv("FFDD_CACHE_DIR", str(tmp_path))
+    files = convert_fission_yields()
+    assert filepath in files
+    assert len(list(tmp_path.glob("yields-v*.npz"))) == len(files)